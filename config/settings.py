@@ -29,7 +29,12 @@ GOOGLE_SHEET_CONFIG = {
     "scope": [
         "https://spreadsheets.google.com/feeds",
         "https://www.googleapis.com/auth/drive"
-    ]
+    ],
+    "max_retries": 6,  # Retry untuk error 429/5xx dari API
+    "log_batch_size": 50,  # Jumlah log aktivitas per batch flush
+    "log_flush_interval": 60,  # Flush log aktivitas paling lambat tiap N detik
+    "id_cache_file": "~/.wsa_gsheet_ids.json",  # Cache client_email:nama spreadsheet -> ID
+    "info_ttl": 60  # TTL cache get_sheet_info (detik)
 }
 
 # ==========================================
@@ -124,12 +129,16 @@ UI_CONFIG = {
 # KONFIGURASI EXPORT
 # ==========================================
 EXPORT_CONFIG = {
-    "formats": ["xlsx", "csv", "json"],
+    "formats": ["xlsx", "csv", "json", "parquet"],
     "default_format": "xlsx",
     "excel_engine": "xlsxwriter",
     "csv_encoding": "utf-8-sig",
     "date_format": "%d%m%Y",
-    "filename_prefix": "WSA_Cleaned"
+    "filename_prefix": "WSA_Cleaned",
+    "autofit_sample_rows": 1000,  # Baris yang dipakai untuk estimasi lebar kolom
+    "streaming_min_rows": 100_000,  # Export Excel mode streaming mulai jumlah baris ini
+    "segment_rows": 250_000,  # Baris per file pada export Excel tersegmentasi
+    "segment_options": [100_000, 250_000, 500_000, 1_000_000]
 }
 
 # ==========================================
@@ -141,8 +150,11 @@ QUALITY_CONFIG = {
     "check_format": True,
     "null_threshold": 0.1,  # 10% null = warning
     "duplicate_threshold": 0.05,  # 5% duplicate = warning
+    "duplicate_subset": None,  # Kolom kunci untuk cek duplikat (None = seluruh kolom)
     "validate_phone": True,
-    "validate_dates": True
+    "validate_dates": True,
+    "keep_indices": False,  # Simpan index baris terdampak di setiap issue
+    "parallel_min_rows": 100_000  # Jalankan pengecekan paralel mulai jumlah baris ini
 }
 
 # ==========================================
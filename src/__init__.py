@@ -4,13 +4,14 @@ Source Package untuk WSA Fulfillment Pro
 
 from .utils import (
     setup_logger, logger,
-    parse_date, format_date, get_bulan_indonesia, get_current_period,
-    clean_string, normalize_phone, validate_phone, extract_order_id,
+    parse_date, parse_date_series, format_date, get_bulan_indonesia, get_current_period,
+    clean_string, clean_string_series, normalize_phone, normalize_phone_series,
+    validate_phone, validate_phone_array, extract_order_id,
     clean_dataframe, safe_convert_numeric, reorder_columns, get_column_stats,
-    export_to_excel, export_to_csv, export_to_json,
+    export_to_excel, export_to_excel_segmented, export_to_csv, export_to_json, export_to_parquet,
     validate_file_extension, validate_required_columns,
-    generate_hash, mask_sensitive_data,
-    chunk_list, memory_usage,
+    generate_hash, generate_hashes, mask_sensitive_data, mask_series,
+    chunk_list, chunk_array, memory_usage,
     create_notification,
     init_session_state, get_session_state, set_session_state
 )
@@ -27,13 +28,15 @@ from .quality_checker import (
 __all__ = [
     # Utils
     'setup_logger', 'logger',
-    'parse_date', 'format_date', 'get_bulan_indonesia', 'get_current_period',
-    'clean_string', 'normalize_phone', 'validate_phone', 'extract_order_id',
+    'parse_date', 'parse_date_series', 'format_date', 'get_bulan_indonesia', 'get_current_period',
+    'clean_string', 'clean_string_series', 'normalize_phone', 'normalize_phone_series',
+    'validate_phone', 'validate_phone_array', 'extract_order_id',
     'clean_dataframe', 'safe_convert_numeric', 'reorder_columns', 'get_column_stats',
-    'export_to_excel', 'export_to_csv', 'export_to_json',
+    'export_to_excel', 'export_to_excel_segmented', 'export_to_csv', 'export_to_json',
+    'export_to_parquet',
     'validate_file_extension', 'validate_required_columns',
-    'generate_hash', 'mask_sensitive_data',
-    'chunk_list', 'memory_usage',
+    'generate_hash', 'generate_hashes', 'mask_sensitive_data', 'mask_series',
+    'chunk_list', 'chunk_array', 'memory_usage',
     'create_notification',
     'init_session_state', 'get_session_state', 'set_session_state',
     # Data Processor
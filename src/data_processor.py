@@ -3,7 +3,6 @@ Data Processor untuk WSA Fulfillment Pro
 Berisi logika bisnis untuk memproses data WSA, MODOROSO, dan WAPPR
 """
 
-import re
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple, Optional, Any
@@ -13,9 +12,9 @@ from config.settings import (
     COLUMN_MAPPINGS, FILTER_CONFIG, BULAN_SINGKAT
 )
 from src.utils import (
-    logger, clean_string, parse_date, format_date,
-    clean_dataframe, reorder_columns, normalize_phone,
-    extract_order_id
+    logger, parse_date_series,
+    clean_dataframe, reorder_columns,
+    clean_string_series, normalize_phone_series
 )
 
 
@@ -24,6 +23,12 @@ class DataProcessor:
     Kelas utama untuk memproses data WSA
     """
     
+    # Kolom yang diisi ulang oleh _finish_mode per mode
+    _MODE_COLS = {
+        'WSA': ('Contact Number',),
+        'MODOROSO': ('CRM Order Type', 'Mitra')
+    }
+    
     def __init__(self, mode: str = "WSA"):
         """
         Inisialisasi DataProcessor
@@ -40,6 +45,57 @@ class DataProcessor:
         
         logger.info(f"DataProcessor initialized with mode: {self.mode}")
     
+    @property
+    def df_processed(self) -> Optional[pd.DataFrame]:
+        """
+        DataFrame hasil proses; filter yang tertunda diterapkan sekali saat diakses
+        
+        Returns:
+            DataFrame atau None jika belum di-clean
+        """
+        self._apply_pending()
+        return self._df_processed
+    
+    @df_processed.setter
+    def df_processed(self, df: Optional[pd.DataFrame]) -> None:
+        self._df_processed = df
+        self._pending_mask = None
+        self._mode_source = None
+    
+    def _apply_pending(self) -> None:
+        """Terapkan filter yang tertunda ke DataFrame dasar"""
+        if self._pending_mask is not None:
+            self._df_processed = self._materialize(self._pending_mask)
+            self._pending_mask = None
+            self._mode_source = None
+    
+    def _materialize(self, mask: np.ndarray) -> pd.DataFrame:
+        """
+        Slice DataFrame dasar dengan mask lalu lengkapi kolom khusus mode
+        
+        Args:
+            mask: Boolean array terhadap DataFrame dasar
+            
+        Returns:
+            DataFrame hasil filter
+        """
+        df = self._df_processed[mask]
+        if self._mode_source is None:
+            return df.copy()
+        
+        # Mapping Contact Number diambil dari seluruh baris hasil filter mode
+        source = None
+        if self.mode == "WSA" and {'Customer Name', 'Contact Number'} <= set(df.columns):
+            source = self._df_processed.loc[self._mode_source, ['Customer Name', 'Contact Number']]
+        
+        return self._finish_mode(df, source)
+    
+    def _current_mask(self) -> np.ndarray:
+        """Mask tertunda saat ini (semua True jika tidak ada filter tertunda)"""
+        if self._pending_mask is None:
+            return np.ones(len(self._df_processed), dtype=bool)
+        return self._pending_mask
+    
     def load_data(self, df: pd.DataFrame) -> 'DataProcessor':
         """
         Load data mentah
@@ -70,10 +126,10 @@ class DataProcessor:
         
         df = self.df_raw.copy()
         
-        # Clean Workorder
+        # Clean Workorder (suffix '.0' dibuang lagi setelah clean_string)
         if 'Workorder' in df.columns:
-            df['Workorder'] = df['Workorder'].apply(
-                lambda x: re.sub(r'\.0$', '', clean_string(x))
+            df['Workorder'] = clean_string_series(df['Workorder']).str.replace(
+                r'\.0$', '', regex=True
             )
         
         # Clean Booking Date
@@ -82,20 +138,19 @@ class DataProcessor:
         
         # Parse Date Created
         if 'Date Created' in df.columns:
-            df['Date Created DT'] = df['Date Created'].apply(parse_date)
-            df['Date Created Display'] = df['Date Created DT'].apply(
-                lambda x: format_date(x, '%d/%m/%Y %H:%M') if x else ''
+            df['Date Created DT'] = parse_date_series(df['Date Created'])
+            df['Date Created Display'] = (
+                df['Date Created DT'].dt.strftime('%d/%m/%Y %H:%M').fillna('')
             )
         
         # Clean Contact Number
         if 'Contact Number' in df.columns:
-            df['Contact Number'] = df['Contact Number'].apply(normalize_phone)
+            df['Contact Number'] = normalize_phone_series(df['Contact Number'])
         
-        # Clean SC Order No
+        # Clean SC Order No (sama dengan extract_order_id(clean_string(x)))
         if self.col_sc in df.columns:
-            df[self.col_sc] = df[self.col_sc].apply(
-                lambda x: extract_order_id(clean_string(x))
-            )
+            order_id = clean_string_series(clean_string_series(df[self.col_sc]))
+            df[self.col_sc] = order_id.str.split('_', n=1).str[0]
         
         self.df_processed = df
         self.stats['cleaned_rows'] = len(df)
@@ -114,145 +169,145 @@ class DataProcessor:
         if self.df_processed is None:
             raise ValueError("Data belum di-clean. Panggil clean_common() terlebih dahulu.")
         
-        df = self.df_processed.copy()
-        
-        if self.mode == "WSA":
-            df = self._filter_wsa(df)
-        elif self.mode == "MODOROSO":
-            df = self._filter_modoroso(df)
-        elif self.mode == "WAPPR":
-            df = self._filter_wappr(df)
+        # Hanya simpan mask; slice + kolom khusus mode ditunda sampai diakses
+        mode_mask = self._mode_mask(self._df_processed)
+        self._pending_mask = mode_mask
+        self._mode_source = mode_mask
         
-        self.df_processed = df
-        self.stats['filtered_rows'] = len(df)
+        filtered_rows = int(np.count_nonzero(mode_mask))
+        self.stats['filtered_rows'] = filtered_rows
         
-        logger.info(f"Mode filtering completed. Rows: {len(df)}")
+        logger.info(f"Mode filtering completed. Rows: {filtered_rows}")
         
         return self
     
-    def _filter_wsa(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _mode_mask(self, df: pd.DataFrame) -> np.ndarray:
         """
-        Filter untuk mode WSA
+        Mask baris yang lolos filter mode (WSA, MODOROSO, WAPPR)
         
         Args:
             df: DataFrame input
             
         Returns:
-            DataFrame yang sudah difilter
+            Boolean array
         """
-        config = FILTER_CONFIG['WSA']
+        mask = np.ones(len(df), dtype=bool)
         
-        # Filter by pattern
-        if self.col_sc in df.columns:
-            pattern = '|'.join(config['patterns'])
-            df = df[df[self.col_sc].astype(str).str.contains(pattern, na=False, case=False)]
+        if self.mode == "WSA":
+            config = FILTER_CONFIG['WSA']
+            
+            # Filter by pattern
+            if self.col_sc in df.columns:
+                mask &= self._pattern_mask(df, config['patterns'])
+            
+            # Filter by CRM Order Type
+            if 'CRM Order Type' in df.columns:
+                mask &= df['CRM Order Type'].isin(config['crm_order_types']).to_numpy()
         
-        # Filter by CRM Order Type
-        if 'CRM Order Type' in df.columns:
-            df = df[df['CRM Order Type'].isin(config['crm_order_types'])]
+        elif self.mode == "MODOROSO":
+            config = FILTER_CONFIG['MODOROSO']
+            
+            # Filter by pattern
+            if self.col_sc in df.columns:
+                mask &= self._pattern_mask(
+                    df, config['patterns'], case=config.get('case_sensitive', False)
+                )
         
-        # Fill Contact Number dari mapping Customer Name
-        if 'Contact Number' in df.columns and 'Customer Name' in df.columns:
-            df = self._fill_contact_number(df)
+        elif self.mode == "WAPPR":
+            config = FILTER_CONFIG['WAPPR']
+            
+            # Filter by pattern
+            if self.col_sc in df.columns:
+                mask &= self._pattern_mask(df, config['patterns'])
+            
+            # Filter by Status
+            if 'Status' in df.columns:
+                mask &= df['Status'].astype(str).str.strip().str.upper().isin(
+                    [s.upper() for s in config['status_filter']]
+                ).to_numpy()
         
-        return df
+        return mask
     
-    def _filter_modoroso(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _finish_mode(self, df: pd.DataFrame, source: pd.DataFrame = None) -> pd.DataFrame:
         """
-        Filter untuk mode MODOROSO
+        Lengkapi kolom khusus mode pada baris yang sudah difilter
         
         Args:
-            df: DataFrame input
+            df: DataFrame yang sudah difilter
+            source: Baris hasil filter mode untuk mapping Contact Number (default: df)
             
         Returns:
-            DataFrame yang sudah difilter
+            DataFrame yang sudah dilengkapi
         """
-        config = FILTER_CONFIG['MODOROSO']
-        
-        # Filter by pattern
-        if self.col_sc in df.columns:
-            pattern = '|'.join(config['patterns'])
-            df = df[df[self.col_sc].astype(str).str.contains(
-                pattern, na=False, case=config.get('case_sensitive', False)
-            )].copy()
-        
-        # Detect MO/DO type
-        if 'CRM Order Type' in df.columns:
-            df['CRM Order Type'] = df[self.col_sc].apply(self._detect_mo_do)
+        if self.mode == "WSA":
+            # Fill Contact Number dari mapping Customer Name
+            if 'Contact Number' in df.columns and 'Customer Name' in df.columns:
+                df = self._fill_contact_number(df, source)
         
-        # Set Mitra
-        df['Mitra'] = config.get('default_mitra', 'TSEL')
+        elif self.mode == "MODOROSO":
+            config = FILTER_CONFIG['MODOROSO']
+            df = df.copy()
+            
+            # Detect MO/DO type ('-MO' diutamakan, default MO)
+            if 'CRM Order Type' in df.columns:
+                sc_upper = clean_string_series(df[self.col_sc], uppercase=True)
+                is_do = (
+                    ~sc_upper.str.contains('-MO', regex=False)
+                    & sc_upper.str.contains('-DO', regex=False)
+                )
+                df['CRM Order Type'] = np.where(is_do, 'DO', 'MO')
+            
+            # Set Mitra
+            df['Mitra'] = config.get('default_mitra', 'TSEL')
         
         return df
     
-    def _filter_wappr(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _pattern_mask(self, df: pd.DataFrame, patterns: List[str], case: bool = False) -> np.ndarray:
         """
-        Filter untuk mode WAPPR
+        Mask baris yang kolom SC Order-nya mengandung salah satu pattern
         
         Args:
             df: DataFrame input
+            patterns: List pattern (regex)
+            case: Case sensitive atau tidak
             
         Returns:
-            DataFrame yang sudah difilter
-        """
-        config = FILTER_CONFIG['WAPPR']
-        
-        # Filter by pattern
-        if self.col_sc in df.columns:
-            pattern = '|'.join(config['patterns'])
-            df = df[df[self.col_sc].astype(str).str.contains(pattern, na=False, case=False)]
-        
-        # Filter by Status
-        if 'Status' in df.columns:
-            df = df[df['Status'].astype(str).str.strip().str.upper().isin(
-                [s.upper() for s in config['status_filter']]
-            )]
-        
-        return df
-    
-    def _detect_mo_do(self, val: str) -> str:
+            Boolean array
         """
-        Deteksi tipe MO atau DO
-        
-        Args:
-            val: Nilai yang akan dideteksi
-            
-        Returns:
-            'MO' atau 'DO'
-        """
-        s = clean_string(val, uppercase=True)
-        if '-MO' in s:
-            return 'MO'
-        if '-DO' in s:
-            return 'DO'
-        return 'MO'  # Default
+        pattern = '|'.join(patterns)
+        return df[self.col_sc].astype(str).str.contains(pattern, na=False, case=case).to_numpy(dtype=bool)
     
-    def _fill_contact_number(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _fill_contact_number(self, df: pd.DataFrame, source: pd.DataFrame = None) -> pd.DataFrame:
         """
         Isi Contact Number yang kosong dari mapping Customer Name
         
         Args:
             df: DataFrame input
+            source: DataFrame sumber mapping (default: df)
             
         Returns:
             DataFrame dengan Contact Number yang sudah diisi
         """
+        if source is None:
+            source = df
+        
         # Buat mapping Customer Name -> Contact Number
-        c_map = df.loc[
-            df['Contact Number'].notna() & (df['Contact Number'] != ''),
+        c_map = source.loc[
+            source['Contact Number'].notna() & (source['Contact Number'] != ''),
             ['Customer Name', 'Contact Number']
         ].drop_duplicates('Customer Name')
         
         c_dict = dict(zip(c_map['Customer Name'], c_map['Contact Number']))
         
-        # Fill missing Contact Number
-        def fill_contact(row):
-            val = str(row['Contact Number'])
-            if pd.isna(row['Contact Number']) or val.strip() == '' or val.lower() == 'nan':
-                return c_dict.get(row['Customer Name'], row['Contact Number'])
-            return row['Contact Number']
+        # Fill missing Contact Number (vektor, tanpa apply per baris)
+        contact = df['Contact Number']
+        text = contact.astype('string')
+        missing = (
+            contact.isna() | text.str.strip().eq('') | text.str.lower().eq('nan')
+        ).to_numpy(dtype=bool, na_value=True)
         
-        df['Contact Number'] = df.apply(fill_contact, axis=1)
+        filled = df['Customer Name'].map(c_dict)
+        df['Contact Number'] = contact.mask(missing & filled.notna().to_numpy(), filled)
         
         return df
     
@@ -266,27 +321,25 @@ class DataProcessor:
         Returns:
             Self untuk method chaining
         """
-        if self.df_processed is None:
+        if self._df_processed is None:
             raise ValueError("Data belum di-filter. Panggil filter_by_mode() terlebih dahulu.")
         
-        if not months:
-            logger.warning("No months selected, skipping month filter")
+        # 'Date Created DT' tidak diubah oleh filter mode, jadi mask bisa
+        # dihitung pada DataFrame dasar dan digabung dengan mask tertunda
+        month_mask = self._month_mask(self._df_processed, months)
+        if month_mask is None:
             return self
         
-        if 'Date Created DT' not in self.df_processed.columns:
-            logger.warning("Date Created DT column not found, skipping month filter")
-            return self
+        mask = self._current_mask()
+        before_count = int(np.count_nonzero(mask))
         
-        df = self.df_processed.copy()
-        before_count = len(df)
+        mask = mask & month_mask
         
-        df = df[df['Date Created DT'].dt.month.isin(months)]
-        
-        after_count = len(df)
+        after_count = int(np.count_nonzero(mask))
         self.stats['month_filtered_rows'] = after_count
         self.stats['month_filtered_out'] = before_count - after_count
         
-        self.df_processed = df
+        self._pending_mask = mask
         
         logger.info(f"Month filter completed. Rows: {after_count} (filtered out: {before_count - after_count})")
         
@@ -303,27 +356,27 @@ class DataProcessor:
         Returns:
             Self untuk method chaining
         """
-        if self.df_processed is None:
+        if self._df_processed is None:
             raise ValueError("Data belum di-filter. Panggil filter_by_mode() terlebih dahulu.")
         
         if check_col is None:
             check_col = self.col_sc if self.mode in ['WSA', 'WAPPR'] else 'Workorder'
         
-        if check_col not in self.df_processed.columns:
-            logger.warning(f"Check column {check_col} not found, skipping duplicate removal")
+        # Kolom yang diisi ulang oleh filter mode harus dicek setelah diterapkan
+        if self._mode_source is not None and check_col in self._MODE_COLS.get(self.mode, ()):
+            self._apply_pending()
+        
+        dup_mask = self._existing_mask(self._df_processed, existing_ids, check_col)
+        if dup_mask is None:
             self.df_final = self.df_processed.copy()
             return self
         
-        df = self.df_processed.copy()
-        before_count = len(df)
-        
-        # Clean existing IDs
-        existing_ids = [clean_string(str(x)) for x in existing_ids]
+        mask = self._current_mask()
+        before_count = int(np.count_nonzero(mask))
         
-        # Remove duplicates
-        df['__check_val'] = df[check_col].astype(str).str.strip()
-        df = df[~df['__check_val'].isin(existing_ids)].copy()
-        df = df.drop(columns=['__check_val'])
+        # Remove duplicates (satu slice untuk semua filter tertunda)
+        mask = mask & ~dup_mask
+        df = self._materialize(mask)
         
         after_count = len(df)
         self.stats['unique_rows'] = after_count
@@ -335,6 +388,74 @@ class DataProcessor:
         
         return self
     
+    def _month_mask(self, df: pd.DataFrame, months: List[int]) -> Optional[np.ndarray]:
+        """
+        Mask baris yang masuk bulan terpilih
+        
+        Args:
+            df: DataFrame input
+            months: List bulan (1-12)
+            
+        Returns:
+            Boolean array, atau None jika filter bulan dilewati
+        """
+        if not months:
+            logger.warning("No months selected, skipping month filter")
+            return None
+        
+        if 'Date Created DT' not in df.columns:
+            logger.warning("Date Created DT column not found, skipping month filter")
+            return None
+        
+        return df['Date Created DT'].dt.month.isin(months).to_numpy()
+    
+    def _existing_mask(self, df: pd.DataFrame, existing_ids: List[str],
+                       check_col: str = None) -> Optional[np.ndarray]:
+        """
+        Mask baris yang ID-nya sudah ada di Google Sheets
+        
+        Args:
+            df: DataFrame input
+            existing_ids: List ID yang sudah ada
+            check_col: Kolom untuk pengecekan duplikat
+            
+        Returns:
+            Boolean array, atau None jika kolom pengecekan tidak ada
+        """
+        if check_col is None:
+            check_col = self.col_sc if self.mode in ['WSA', 'WAPPR'] else 'Workorder'
+        
+        if check_col not in df.columns:
+            logger.warning(f"Check column {check_col} not found, skipping duplicate removal")
+            return None
+        
+        # Clean existing IDs (set untuk lookup hash)
+        existing_ids = set(clean_string_series([str(x) for x in existing_ids]))
+        
+        check_val = df[check_col].astype(str).str.strip()
+        return check_val.isin(existing_ids).to_numpy()
+    
+    def apply_all_filters(self, months: List[int] = None, existing_ids: List[str] = None,
+                          check_col: str = None) -> 'DataProcessor':
+        """
+        Filter mode, bulan dan duplikat dalam satu pass boolean mask
+        
+        Filter berantai hanya menggabungkan mask; DataFrame di-slice sekali
+        saat df_final dibentuk (df_processed baru di-slice jika diakses).
+        
+        Args:
+            months: List bulan (1-12)
+            existing_ids: List ID yang sudah ada
+            check_col: Kolom untuk pengecekan duplikat
+            
+        Returns:
+            Self untuk method chaining
+        """
+        return (self
+                .filter_by_mode()
+                .filter_by_month(months or [])
+                .remove_duplicates(existing_ids or [], check_col))
+    
     def finalize(self, sort_by: str = 'Workzone') -> pd.DataFrame:
         """
         Finalisasi data untuk output
@@ -398,9 +519,7 @@ class DataProcessor:
         return (self
                 .load_data(df)
                 .clean_common()
-                .filter_by_mode()
-                .filter_by_month(months or [])
-                .remove_duplicates(existing_ids or [])
+                .apply_all_filters(months, existing_ids)
                 .finalize())
 
 
@@ -5,17 +5,203 @@ Berisi fungsi-fungsi untuk berinteraksi dengan Google Sheets API
 
 import json
 import time
+import random
+import weakref
+import functools
+import threading
+from collections import deque
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
+from pathlib import Path
 
 import gspread
+from gspread.urls import DRIVE_FILES_API_V3_URL
 import pandas as pd
-from oauth2client.service_account import ServiceAccountCredentials
+from google.oauth2.service_account import Credentials
 
-from config.settings import GOOGLE_SHEET_CONFIG
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # pragma: no cover - pyarrow opsional
+    pa = None
+    pc = None
+
+try:
+    from gspread_dataframe import set_with_dataframe
+except ImportError:  # pragma: no cover - gspread-dataframe opsional
+    set_with_dataframe = None
+
+from config.settings import GOOGLE_SHEET_CONFIG, CACHE_CONFIG
 from src.utils import logger, clean_string
 
 
+# Status HTTP yang bersifat sementara (rate limit / server error)
+RETRYABLE_STATUS = (429, 500, 502, 503, 504)
+
+# Append tidak idempoten: 5xx bisa terjadi setelah server menulis baris,
+# jadi hanya 429 (request pasti ditolak) yang aman di-retry
+APPEND_RETRY_STATUS = (429,)
+
+
+def _with_retry(fn, retry_statuses: Tuple[int, ...] = RETRYABLE_STATUS):
+    """
+    Decorator untuk retry panggilan API dengan exponential backoff
+    
+    Hanya retry untuk APIError dengan status sementara (default 429/5xx),
+    dan menghormati header Retry-After jika ada.
+    
+    Args:
+        fn: Fungsi yang memanggil Google Sheets API
+        retry_statuses: Status HTTP yang di-retry
+        
+    Returns:
+        Fungsi yang sudah dibungkus retry
+    """
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        # Minimal satu percobaan walaupun max_retries diset 0
+        max_retries = max(1, GOOGLE_SHEET_CONFIG.get('max_retries', 6))
+        
+        for attempt in range(max_retries):
+            try:
+                return fn(*args, **kwargs)
+            except gspread.exceptions.APIError as e:
+                response = getattr(e, 'response', None)
+                status = getattr(response, 'status_code', None)
+                
+                if status not in retry_statuses or attempt == max_retries - 1:
+                    raise
+                
+                try:
+                    delay = int(response.headers.get('Retry-After', 2 ** attempt))
+                except (TypeError, ValueError):
+                    delay = 2 ** attempt
+                
+                logger.warning(
+                    f"Google Sheets API returned {status}, retrying in {delay}s "
+                    f"(attempt {attempt + 1}/{max_retries})"
+                )
+                time.sleep(delay + random.random() * 0.5)
+    
+    return wrapper
+
+
+@functools.lru_cache(maxsize=4)
+def _build_creds(creds_json: str, scope: Tuple[str, ...]) -> Credentials:
+    """
+    Buat credentials service account (di-cache per isi credentials + scope)
+    
+    Args:
+        creds_json: Credentials dalam bentuk JSON string (sort_keys)
+        scope: Tuple scope OAuth
+        
+    Returns:
+        Credentials object
+    """
+    return Credentials.from_service_account_info(json.loads(creds_json), scopes=list(scope))
+
+
+def _get_credentials(creds: Dict) -> Credentials:
+    """
+    Normalisasi private key lalu ambil credentials dari cache
+    
+    Args:
+        creds: Dictionary credentials service account
+        
+    Returns:
+        Credentials object
+    """
+    info = dict(creds)
+    if 'private_key' in info:
+        info['private_key'] = info['private_key'].replace('\\n', '\n')
+    
+    return _build_creds(
+        json.dumps(info, sort_keys=True),
+        tuple(GOOGLE_SHEET_CONFIG['scope'])
+    )
+
+
+def _df_to_values(df: pd.DataFrame) -> List[List[Any]]:
+    """
+    Konversi DataFrame ke list of lists (tanpa header) untuk dikirim ke Sheets
+    
+    Args:
+        df: DataFrame input
+        
+    Returns:
+        List baris nilai
+    """
+    # values.tolist() lebih cepat dari konversi Arrow/kolom per baris
+    # untuk frame campuran (banyak kolom string)
+    return df.values.tolist()
+
+
+# Header worksheet log aktivitas
+_LOG_HEADER = ['Timestamp', 'User', 'Action', 'Mode', 'Rows', 'Status', 'Message']
+
+
+def _flush_log_queue(log_q: deque, spreadsheet: gspread.Spreadsheet,
+                     ws_index: Dict[str, gspread.Worksheet] = None) -> bool:
+    """
+    Kirim log aktivitas di buffer ke worksheet-nya masing-masing
+    
+    Dipakai oleh flush_log() dan finalizer manager, sehingga tidak boleh
+    menyimpan referensi ke GoogleSheetsManager.
+    
+    Args:
+        log_q: Buffer (worksheet_name, log_entry); entry terkirim dihapus in-place
+        spreadsheet: Spreadsheet tujuan
+        ws_index: Index nama -> worksheet yang sudah segar (opsional, di-update
+            jika sheet dibuat); tanpa index, worksheet dicari langsung ke server
+        
+    Returns:
+        True jika berhasil
+    """
+    if not log_q:
+        return True
+    
+    # Group entries per worksheet
+    pending: Dict[str, List[List[Any]]] = {}
+    for worksheet_name, log_entry in log_q:
+        pending.setdefault(worksheet_name, []).append(log_entry)
+    
+    success = True
+    
+    for worksheet_name, rows in pending.items():
+        try:
+            # Get or create log worksheet (tanpa request metadata per flush)
+            ws = None
+            if ws_index is not None:
+                ws = ws_index.get(worksheet_name)
+            else:
+                try:
+                    ws = _with_retry(spreadsheet.worksheet)(worksheet_name)
+                except gspread.WorksheetNotFound:
+                    pass
+            
+            if ws is None:
+                ws = _with_retry(spreadsheet.add_worksheet)(worksheet_name, rows=1000, cols=10)
+                if ws_index is not None:
+                    ws_index[worksheet_name] = ws
+                # Add header
+                _with_retry(ws.append_row, APPEND_RETRY_STATUS)(_LOG_HEADER)
+            
+            _with_retry(ws.append_rows, APPEND_RETRY_STATUS)(rows, value_input_option='RAW')
+            
+            # Hapus entry yang sudah terkirim dari buffer (in-place)
+            remaining = [item for item in log_q if item[0] != worksheet_name]
+            log_q.clear()
+            log_q.extend(remaining)
+            
+            logger.info(f"Flushed {len(rows)} activity log entries to '{worksheet_name}'")
+            
+        except Exception as e:
+            logger.error(f"Failed to log activity: {e}")
+            success = False
+    
+    return success
+
+
 class GoogleSheetsManager:
     """
     Manager untuk operasi Google Sheets
@@ -34,6 +220,15 @@ class GoogleSheetsManager:
         self.worksheets = {}
         self.connection_status = False
         
+        self._sheet_info_cache = None
+        self._client_email = ''
+        self._sid_cache_path = Path(GOOGLE_SHEET_CONFIG['id_cache_file']).expanduser()
+        
+        # Buffer log aktivitas: (worksheet_name, log_entry)
+        self._log_q = deque()
+        self._log_flushed_at = time.monotonic()
+        self._log_finalizer = None
+        
         logger.info("GoogleSheetsManager initialized")
     
     def connect(self, credentials: Dict = None) -> bool:
@@ -53,18 +248,13 @@ class GoogleSheetsManager:
             return False
         
         try:
-            # Fix private key format
-            info = dict(creds)
-            if 'private_key' in info:
-                info['private_key'] = info['private_key'].replace('\\n', '\n')
-            
-            # Create credentials
-            scope = GOOGLE_SHEET_CONFIG['scope']
-            credentials_obj = ServiceAccountCredentials.from_json_keyfile_dict(info, scope)
+            # Create credentials (cached)
+            credentials_obj = _get_credentials(creds)
             
             # Authorize
             self.client = gspread.authorize(credentials_obj)
             self.connection_status = True
+            self._client_email = creds.get('client_email', '')
             
             logger.info("Successfully connected to Google Sheets API")
             return True
@@ -91,7 +281,30 @@ class GoogleSheetsManager:
         name = spreadsheet_name or GOOGLE_SHEET_CONFIG['spreadsheet_name']
         
         try:
-            self.spreadsheet = self.client.open(name)
+            self._reset_ws_index()
+            sid_cache = self._load_sid_cache()
+            
+            # ID di-cache per service account: akun lain belum tentu punya akses
+            cache_key = f"{self._client_email}:{name}"
+            
+            # Pakai ID yang sudah di-cache untuk skip pencarian Drive
+            if cache_key in sid_cache:
+                try:
+                    self.spreadsheet = _with_retry(self.client.open_by_key)(sid_cache[cache_key])
+                    self._register_log_finalizer()
+                    logger.info(f"Opened spreadsheet: {name}")
+                    return True
+                except (gspread.SpreadsheetNotFound, PermissionError):
+                    logger.warning(f"Cached ID for '{name}' is stale, looking up by name")
+                    del sid_cache[cache_key]
+                    self._save_sid_cache(sid_cache)
+            
+            self.spreadsheet = _with_retry(self.client.open)(name)
+            
+            sid_cache[cache_key] = self.spreadsheet.id
+            self._save_sid_cache(sid_cache)
+            self._register_log_finalizer()
+            
             logger.info(f"Opened spreadsheet: {name}")
             return True
             
@@ -99,6 +312,62 @@ class GoogleSheetsManager:
             logger.error(f"Failed to open spreadsheet '{name}': {e}")
             return False
     
+    def _register_log_finalizer(self) -> None:
+        """
+        Pastikan sisa log aktivitas dikirim saat manager di-GC atau proses selesai
+        
+        Finalizer hanya memegang buffer dan spreadsheet, bukan manager itu
+        sendiri, sehingga manager tetap bisa di-GC.
+        """
+        if self._log_finalizer is not None:
+            self._log_finalizer.detach()
+        
+        self._log_finalizer = weakref.finalize(
+            self, _flush_log_queue, self._log_q, self.spreadsheet
+        )
+    
+    @functools.cached_property
+    def _ws_index(self) -> Dict[str, gspread.Worksheet]:
+        """
+        Index nama -> worksheet, diambil sekali dari metadata spreadsheet
+        
+        Returns:
+            Dictionary worksheet berdasarkan judul
+        """
+        return {ws.title: ws for ws in _with_retry(self.spreadsheet.worksheets)()}
+    
+    def _reset_ws_index(self) -> None:
+        """Hapus index worksheet dan info sheet agar diambil ulang pada akses berikutnya"""
+        self.__dict__.pop('_ws_index', None)
+        self._sheet_info_cache = None
+    
+    def _load_sid_cache(self) -> Dict[str, str]:
+        """
+        Baca cache "client_email:nama spreadsheet" -> ID dari file
+        
+        Returns:
+            Dictionary cache (kosong jika file tidak ada/rusak)
+        """
+        try:
+            with open(self._sid_cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            return cache if isinstance(cache, dict) else {}
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_sid_cache(self, cache: Dict[str, str]) -> None:
+        """
+        Simpan cache "client_email:nama spreadsheet" -> ID ke file
+        
+        Args:
+            cache: Dictionary cache
+        """
+        try:
+            with open(self._sid_cache_path, 'w', encoding='utf-8') as f:
+                json.dump(cache, f)
+        except OSError as e:
+            logger.warning(f"Failed to save spreadsheet ID cache: {e}")
+    
     def get_worksheet(self, worksheet_name: str = None, index: int = None) -> Optional[gspread.Worksheet]:
         """
         Ambil worksheet
@@ -116,17 +385,17 @@ class GoogleSheetsManager:
         
         try:
             if worksheet_name:
-                ws = self.spreadsheet.worksheet(worksheet_name)
+                ws = _with_retry(self.spreadsheet.worksheet)(worksheet_name)
                 self.worksheets[worksheet_name] = ws
                 return ws
             elif index is not None:
-                ws = self.spreadsheet.get_worksheet(index)
+                ws = _with_retry(self.spreadsheet.get_worksheet)(index)
                 if ws:
                     self.worksheets[ws.title] = ws
                 return ws
             else:
                 # Default to first worksheet
-                ws = self.spreadsheet.get_worksheet(0)
+                ws = _with_retry(self.spreadsheet.get_worksheet)(0)
                 if ws:
                     self.worksheets[ws.title] = ws
                 return ws
@@ -172,7 +441,7 @@ class GoogleSheetsManager:
             return pd.DataFrame()
         
         try:
-            data = ws.get_all_records()
+            data = _with_retry(ws.get_all_records)()
             df = pd.DataFrame(data)
             
             logger.info(f"Read {len(df)} rows from worksheet '{ws.title}'")
@@ -201,13 +470,23 @@ class GoogleSheetsManager:
             return []
         
         if column and column in df.columns:
-            ids = df[column].astype(str).str.replace(r'\.0$', '', regex=True).str.strip().unique()
+            series = df[column]
         else:
             # Default to first column
-            ids = df.iloc[:, 0].astype(str).str.replace(r'\.0$', '', regex=True).str.strip().unique()
+            series = df.iloc[:, 0]
+        
+        if pc is not None:
+            # Replace + strip + unique dijalankan di kernel Arrow
+            arr = pa.array(series.astype(str), type=pa.string(), from_pandas=True)
+            arr = pc.fill_null(arr, 'nan')
+            arr = pc.replace_substring_regex(arr, pattern=r'\.0$', replacement='')
+            arr = pc.utf8_trim_whitespace(arr)
+            ids = pc.unique(arr).to_pylist()
+        else:
+            ids = list(series.astype(str).str.replace(r'\.0$', '', regex=True).str.strip().unique())
         
         logger.info(f"Found {len(ids)} existing IDs")
-        return list(ids)
+        return ids
     
     def append_data(self, df: pd.DataFrame, worksheet_name: str = None, 
                     index: int = None, clear_first: bool = False) -> bool:
@@ -230,14 +509,23 @@ class GoogleSheetsManager:
             return False
         
         try:
-            if clear_first:
-                ws.clear()
-            
             # Convert DataFrame to list of lists
-            values = [df.columns.tolist()] + df.values.tolist()
+            values = _df_to_values(df)
+            
+            if clear_first:
+                _with_retry(ws.clear)()
+                
+                # Sheet kosong: perbesar grid sekali, lalu tulis langsung dari A1
+                # tanpa lookup tabel yang dilakukan append
+                if values:
+                    self._ensure_grid_size(ws, len(values), len(df.columns))
+                    _with_retry(ws.update)(range_name='A1', values=values)
+            else:
+                # Append data
+                _with_retry(ws.append_rows, APPEND_RETRY_STATUS)(values)
             
-            # Append data
-            ws.append_rows(values[1:])  # Skip header if not clearing
+            # append_rows ikut memperbesar grid; info sheet sudah basi
+            self._reset_ws_index()
             
             logger.info(f"Appended {len(df)} rows to worksheet '{ws.title}'")
             return True
@@ -246,6 +534,36 @@ class GoogleSheetsManager:
             logger.error(f"Failed to append data: {e}")
             return False
     
+    def _ensure_grid_size(self, ws: gspread.Worksheet, rows: int, cols: int) -> None:
+        """
+        Perbesar jumlah baris dan kolom worksheet dalam satu request jika kurang
+        
+        Args:
+            ws: Worksheet target
+            rows: Jumlah baris minimal
+            cols: Jumlah kolom minimal
+        """
+        if rows <= ws.row_count and cols <= ws.col_count:
+            return
+        
+        _with_retry(self.spreadsheet.batch_update)({
+            'requests': [{
+                'updateSheetProperties': {
+                    'properties': {
+                        'sheetId': ws.id,
+                        'gridProperties': {
+                            'rowCount': max(rows, ws.row_count),
+                            'columnCount': max(cols, ws.col_count)
+                        }
+                    },
+                    'fields': 'gridProperties.rowCount,gridProperties.columnCount'
+                }
+            }]
+        })
+        
+        # Ukuran grid berubah: index worksheet dan info sheet sudah basi
+        self._reset_ws_index()
+    
     def update_data(self, df: pd.DataFrame, worksheet_name: str = None, 
                     index: int = None) -> bool:
         """
@@ -266,14 +584,24 @@ class GoogleSheetsManager:
             return False
         
         try:
-            # Clear existing data
-            ws.clear()
-            
-            # Convert DataFrame to list of lists
-            values = [df.columns.tolist()] + df.values.tolist()
+            if set_with_dataframe is not None:
+                # Resize grid lalu tulis header + data dalam satu update
+                _with_retry(ws.resize)(rows=len(df) + 1, cols=max(len(df.columns), 1))
+                _with_retry(set_with_dataframe)(
+                    ws, df, include_index=False, resize=False, allow_formulas=False
+                )
+            else:
+                # Clear existing data
+                _with_retry(ws.clear)()
+                
+                # Convert DataFrame to list of lists
+                values = [df.columns.tolist()] + _df_to_values(df)
+                
+                # Update data
+                _with_retry(ws.update)(values)
             
-            # Update data
-            ws.update(values)
+            # Ukuran grid berubah: index worksheet dan info sheet sudah basi
+            self._reset_ws_index()
             
             logger.info(f"Updated {len(df)} rows in worksheet '{ws.title}'")
             return True
@@ -286,6 +614,10 @@ class GoogleSheetsManager:
         """
         Log aktivitas ke worksheet
         
+        Entry disimpan di buffer dan dikirim sekaligus lewat flush_log()
+        saat buffer penuh, saat interval flush terlewati, atau ketika
+        manager di-GC/proses selesai.
+        
         Args:
             activity: Dictionary aktivitas
             worksheet_name: Nama worksheet log
@@ -293,34 +625,64 @@ class GoogleSheetsManager:
         Returns:
             True jika berhasil
         """
-        try:
-            # Try to get or create log worksheet
-            try:
-                ws = self.spreadsheet.worksheet(worksheet_name)
-            except gspread.WorksheetNotFound:
-                ws = self.spreadsheet.add_worksheet(worksheet_name, rows=1000, cols=10)
-                # Add header
-                ws.append_row(['Timestamp', 'User', 'Action', 'Mode', 'Rows', 'Status', 'Message'])
-            
-            # Prepare log entry
-            log_entry = [
-                datetime.now().isoformat(),
-                activity.get('user', 'system'),
-                activity.get('action', 'unknown'),
-                activity.get('mode', ''),
-                activity.get('rows', 0),
-                activity.get('status', 'success'),
-                activity.get('message', '')
-            ]
-            
-            ws.append_row(log_entry)
-            
-            logger.info(f"Logged activity: {activity.get('action')}")
+        if not self.spreadsheet:
+            logger.error("Spreadsheet not opened, cannot log activity")
+            return False
+        
+        # Prepare log entry
+        log_entry = [
+            datetime.now().isoformat(),
+            activity.get('user', 'system'),
+            activity.get('action', 'unknown'),
+            activity.get('mode', ''),
+            activity.get('rows', 0),
+            activity.get('status', 'success'),
+            activity.get('message', '')
+        ]
+        
+        self._log_q.append((worksheet_name, log_entry))
+        logger.info(f"Logged activity: {activity.get('action')}")
+        
+        if (len(self._log_q) >= GOOGLE_SHEET_CONFIG.get('log_batch_size', 50)
+                or time.monotonic() - self._log_flushed_at >= GOOGLE_SHEET_CONFIG.get('log_flush_interval', 60)):
+            return self.flush_log()
+        
+        return True
+    
+    def flush_log(self) -> bool:
+        """
+        Kirim semua log aktivitas yang masih di buffer ke worksheet
+        
+        Returns:
+            True jika berhasil
+        """
+        if not self._log_q:
             return True
+        
+        if not self.spreadsheet:
+            logger.error("Spreadsheet not opened, cannot flush activity log")
+            return False
+        
+        self._log_flushed_at = time.monotonic()
+        
+        try:
+            # Worksheet yang belum ada di index mungkin dibuat di tempat lain:
+            # ambil ulang index sekali sebelum membuat sheet baru
+            if not {name for name, _ in self._log_q} <= self._ws_index.keys():
+                self._reset_ws_index()
+            
+            success = _flush_log_queue(self._log_q, self.spreadsheet, self._ws_index)
             
         except Exception as e:
+            # Buffer tetap utuh untuk dicoba lagi pada flush berikutnya
             logger.error(f"Failed to log activity: {e}")
-            return False
+            success = False
+        
+        # Gagal bisa berarti index basi (sheet dihapus/diubah); ambil ulang nanti
+        if not success:
+            self._reset_ws_index()
+        
+        return success
     
     def backup_data(self, worksheet_name: str = None, backup_name: str = None) -> bool:
         """
@@ -337,34 +699,60 @@ class GoogleSheetsManager:
             logger.error("Worksheet name required for backup")
             return False
         
+        if not self.spreadsheet:
+            logger.error("Spreadsheet not opened")
+            return False
+        
+        # Generate backup name
+        if not backup_name:
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            backup_name = f"BACKUP_{worksheet_name}_{timestamp}"
+        
+        if backup_name == worksheet_name:
+            logger.error("Backup name must differ from the source worksheet name")
+            return False
+        
         try:
-            # Read source data
-            df = self.read_data(worksheet_name)
-            
-            if df.empty:
-                logger.warning(f"No data to backup from '{worksheet_name}'")
-                return False
-            
-            # Generate backup name
-            if not backup_name:
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                backup_name = f"BACKUP_{worksheet_name}_{timestamp}"
-            
-            # Create or get backup worksheet
+            source_ws = _with_retry(self.spreadsheet.worksheet)(worksheet_name)
+            
+            # Duplicate dulu ke judul sementara, agar backup lama baru dihapus
+            # setelah salinan baru berhasil dibuat
+            temp_name = f"{backup_name}_tmp_{datetime.now().strftime('%H%M%S%f')}"
+            
+            # Duplicate di sisi server, tanpa download/upload data
+            if hasattr(self.spreadsheet, 'duplicate_sheet'):
+                new_ws = _with_retry(self.spreadsheet.duplicate_sheet)(
+                    source_sheet_id=source_ws.id,
+                    new_sheet_name=temp_name
+                )
+            else:
+                _with_retry(self.spreadsheet.batch_update)({
+                    'requests': [{
+                        'duplicateSheet': {
+                            'sourceSheetId': source_ws.id,
+                            'newSheetName': temp_name
+                        }
+                    }]
+                })
+                new_ws = _with_retry(self.spreadsheet.worksheet)(temp_name)
+            
+            # Replace existing backup worksheet dengan nama yang sama
             try:
-                ws = self.spreadsheet.worksheet(backup_name)
-                ws.clear()
+                old_ws = _with_retry(self.spreadsheet.worksheet)(backup_name)
+                _with_retry(self.spreadsheet.del_worksheet)(old_ws)
             except gspread.WorksheetNotFound:
-                ws = self.spreadsheet.add_worksheet(backup_name, rows=len(df)+10, cols=len(df.columns)+2)
+                pass
             
-            # Write backup data
-            values = [df.columns.tolist()] + df.values.tolist()
-            ws.update(values)
+            _with_retry(new_ws.update_title)(backup_name)
+            
+            self._reset_ws_index()
             
             logger.info(f"Backed up '{worksheet_name}' to '{backup_name}'")
             return True
             
         except Exception as e:
+            # Daftar worksheet bisa sudah berubah walau backup gagal
+            self._reset_ws_index()
             logger.error(f"Failed to backup data: {e}")
             return False
     
@@ -379,22 +767,34 @@ class GoogleSheetsManager:
             logger.error("Spreadsheet not opened")
             return {}
         
+        # Check cache
+        if self._sheet_info_cache is not None:
+            cached_info, cached_time = self._sheet_info_cache
+            if time.time() - cached_time < GOOGLE_SHEET_CONFIG.get('info_ttl', 60):
+                return cached_info
+        
         try:
-            worksheets = self.spreadsheet.worksheets()
+            # Ambil hanya field yang dibutuhkan, bukan seluruh metadata
+            metadata = _with_retry(self.spreadsheet.fetch_sheet_metadata)(params={
+                'fields': 'properties.title,spreadsheetUrl,'
+                          'sheets.properties(title,gridProperties(rowCount,columnCount))'
+            })
             
             info = {
-                'title': self.spreadsheet.title,
-                'url': self.spreadsheet.url,
+                'title': metadata.get('properties', {}).get('title', ''),
+                'url': metadata.get('spreadsheetUrl', self.spreadsheet.url),
                 'worksheets': [
                     {
-                        'title': ws.title,
-                        'rows': ws.row_count,
-                        'cols': ws.col_count
+                        'title': sheet['properties']['title'],
+                        'rows': sheet['properties'].get('gridProperties', {}).get('rowCount', 0),
+                        'cols': sheet['properties'].get('gridProperties', {}).get('columnCount', 0)
                     }
-                    for ws in worksheets
+                    for sheet in metadata.get('sheets', [])
                 ]
             }
             
+            self._sheet_info_cache = (info, time.time())
+            
             return info
             
         except Exception as e:
@@ -412,9 +812,13 @@ class GoogleSheetsManager:
             return False, "Not connected to Google Sheets API"
         
         try:
-            # Try to list spreadsheets
-            spreadsheets = self.client.list_spreadsheet_files()
-            return True, f"Connected. Found {len(spreadsheets)} spreadsheets."
+            # Ping ringan: satu halaman berisi satu file, bukan listing penuh
+            self.client.http_client.request('get', DRIVE_FILES_API_V3_URL, params={
+                'q': "mimeType='application/vnd.google-apps.spreadsheet'",
+                'pageSize': 1,
+                'fields': 'files(id)'
+            })
+            return True, "Connected."
             
         except Exception as e:
             return False, f"Connection test failed: {e}"
@@ -428,6 +832,8 @@ class StreamlitGoogleSheets:
     def __init__(self):
         self.manager = None
         self._cache = {}
+        self._lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
     
     def connect_with_secrets(self) -> bool:
         """
@@ -459,29 +865,59 @@ class StreamlitGoogleSheets:
         Returns:
             DataFrame dengan data
         """
-        import time
-        
         cache_key = f"gsheet_{worksheet_name}"
         
         # Check cache
-        if cache_key in self._cache:
-            cached_data, cached_time = self._cache[cache_key]
-            if time.time() - cached_time < cache_ttl:
-                logger.info(f"Returning cached data for '{worksheet_name}'")
-                return cached_data
+        cached_data = self._get_fresh(cache_key, cache_ttl)
+        if cached_data is not None:
+            logger.info(f"Returning cached data for '{worksheet_name}'")
+            return cached_data
         
         # Fetch fresh data
         if not self.manager:
             logger.error("Not connected")
             return pd.DataFrame()
         
-        df = self.manager.read_data(worksheet_name)
+        with self._lock:
+            key_lock = self._key_locks.setdefault(cache_key, threading.Lock())
         
-        # Update cache
-        self._cache[cache_key] = (df, time.time())
+        # Satu fetch per key: thread lain menunggu lalu memakai hasil cache
+        with key_lock:
+            cached_data = self._get_fresh(cache_key, cache_ttl)
+            if cached_data is not None:
+                return cached_data
+            
+            df = self.manager.read_data(worksheet_name)
+            
+            # Update cache
+            with self._lock:
+                self._cache[cache_key] = (df, time.time())
+                while len(self._cache) > CACHE_CONFIG['max_entries']:
+                    self._cache.pop(next(iter(self._cache)))
         
         return df
     
+    def _get_fresh(self, cache_key: str, cache_ttl: int) -> Optional[pd.DataFrame]:
+        """
+        Ambil data cache jika belum kedaluwarsa
+        
+        Args:
+            cache_key: Key cache
+            cache_ttl: Time to live cache (detik)
+            
+        Returns:
+            DataFrame dari cache atau None
+        """
+        with self._lock:
+            entry = self._cache.get(cache_key)
+        
+        if entry is not None:
+            cached_data, cached_time = entry
+            if time.time() - cached_time < cache_ttl:
+                return cached_data
+        
+        return None
+    
     def clear_cache(self, worksheet_name: str = None):
         """
         Clear cache
@@ -489,11 +925,12 @@ class StreamlitGoogleSheets:
         Args:
             worksheet_name: Nama worksheet (None = clear all)
         """
-        if worksheet_name:
-            cache_key = f"gsheet_{worksheet_name}"
-            self._cache.pop(cache_key, None)
-        else:
-            self._cache.clear()
+        with self._lock:
+            if worksheet_name:
+                cache_key = f"gsheet_{worksheet_name}"
+                self._cache.pop(cache_key, None)
+            else:
+                self._cache.clear()
         
         logger.info("Cache cleared")
 
@@ -512,12 +949,7 @@ def get_gspread_client_streamlit():
         @st.cache_resource
         def _get_client():
             try:
-                info = dict(st.secrets["gcp_service_account"])
-                if 'private_key' in info:
-                    info['private_key'] = info['private_key'].replace('\\n', '\n')
-                
-                scope = GOOGLE_SHEET_CONFIG['scope']
-                creds = ServiceAccountCredentials.from_json_keyfile_dict(info, scope)
+                creds = _get_credentials(st.secrets["gcp_service_account"])
                 client = gspread.authorize(creds)
                 
                 return client
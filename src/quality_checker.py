@@ -4,15 +4,89 @@ Berisi fungsi-fungsi untuk memeriksa dan memastikan kualitas data
 """
 
 import re
+import sys
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Any, Optional, Tuple
+from collections import Counter
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 
-from src.utils import logger, validate_phone, parse_date, clean_string
+from src.utils import logger, validate_phone_array, DATE_FORMATS
 from config.settings import QUALITY_CONFIG
 
+try:
+    import pyarrow  # noqa: F401
+    _STRING_DTYPE = 'string[pyarrow]'
+except ImportError:  # pragma: no cover - pyarrow opsional
+    _STRING_DTYPE = None
+
+
+# Pola standar nomor order
+ORDER_PATTERN = '|'.join(re.escape(p) for p in ['AO', 'PDA', 'WSA', '-MO', '-DO'])
+
+
+def _scan_string_col(values: List[str], counts: Optional[List[int]] = None) -> Tuple[int, int, int, int]:
+    """
+    Hitung statistik format string dalam satu kali iterasi
+    
+    Args:
+        values: List string (tanpa null)
+        counts: Jumlah kemunculan tiap nilai, jika values berisi nilai unik
+        
+    Returns:
+        Tuple (upper_count, lower_count, mixed_count, whitespace_count)
+    """
+    if counts is None:
+        counts = [1] * len(values)
+    
+    upper_count = lower_count = whitespace_count = 0
+    
+    for v, n in zip(values, counts):
+        if v.isupper():
+            upper_count += n
+        elif v.islower():
+            lower_count += n
+        if v != v.strip():
+            whitespace_count += n
+    
+    mixed_count = sum(counts) - upper_count - lower_count
+    
+    return upper_count, lower_count, mixed_count, whitespace_count
+
+
+def _scan_string_series(values: pd.Series, sample_rows: int = 1000) -> Tuple[int, int, int, int]:
+    """
+    Hitung statistik format string kolom, memilih cara tercepat per kardinalitas
+    
+    Kolom dengan banyak nilai unik di-scan langsung dengan .str (kernel Arrow);
+    kolom kategori cukup di-scan per nilai unik lewat _scan_string_col.
+    
+    Args:
+        values: Series string (tanpa null)
+        sample_rows: Jumlah baris awal untuk memperkirakan kardinalitas
+        
+    Returns:
+        Tuple (upper_count, lower_count, mixed_count, whitespace_count)
+    """
+    sample = values.iloc[:sample_rows]
+    
+    if sample.nunique() > len(sample) // 2:
+        is_upper = values.str.isupper().to_numpy(dtype=bool)
+        is_lower = values.str.islower().to_numpy(dtype=bool) & ~is_upper
+        
+        upper_count = int(np.count_nonzero(is_upper))
+        lower_count = int(np.count_nonzero(is_lower))
+        whitespace_count = int(np.count_nonzero((values != values.str.strip()).to_numpy(dtype=bool)))
+        
+        return upper_count, lower_count, len(values) - upper_count - lower_count, whitespace_count
+    
+    # Scan cukup per nilai unik (dibobot jumlahnya); kolom kategori
+    # seperti status atau kota hanya punya sedikit nilai unik
+    value_counts = values.value_counts(sort=False)
+    return _scan_string_col(value_counts.index.tolist(), value_counts.tolist())
+
 
 class QualityLevel(Enum):
     """Level kualitas data"""
@@ -23,7 +97,8 @@ class QualityLevel(Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+# slots=True hanya tersedia mulai Python 3.10
+@dataclass(**({'slots': True} if sys.version_info >= (3, 10) else {}))
 class QualityIssue:
     """Struktur untuk menyimpan issue kualitas"""
     column: str
@@ -31,8 +106,8 @@ class QualityIssue:
     severity: str
     message: str
     affected_rows: int
-    affected_indices: List[int]
     suggestion: str
+    affected_indices: Optional[np.ndarray] = None
 
 
 class DataQualityChecker:
@@ -47,11 +122,28 @@ class DataQualityChecker:
         Args:
             df: DataFrame yang akan dicek
         """
-        self.df = df.copy()
+        # Semua pengecekan hanya membaca data, jadi cukup salinan dangkal;
+        # penggantian kolom di bawah tidak menyentuh DataFrame asli
+        self.df = df.copy(deep=False)
+        self._to_arrow_strings()
+        
+        # Pemilihan kolom per tipe cukup sekali untuk semua pengecekan
+        self._obj_cols = list(self.df.select_dtypes(include=['object', 'string']).columns)
+        self._num_cols = list(self.df.select_dtypes(include=[np.number]).columns)
         self.issues: List[QualityIssue] = []
         self.scores: Dict[str, float] = {}
         self.recommendations: List[str] = []
         
+    def _to_arrow_strings(self) -> None:
+        """Ubah kolom object berisi teks ke string[pyarrow] agar operasi .str memakai kernel Arrow"""
+        if _STRING_DTYPE is None:
+            return
+        
+        for col in self.df.columns[self.df.dtypes == object]:
+            # Kolom campuran (angka + teks) dibiarkan agar nilainya tidak berubah
+            if pd.api.types.infer_dtype(self.df[col], skipna=True) == 'string':
+                self.df[col] = self.df[col].astype(_STRING_DTYPE)
+    
     def run_all_checks(self) -> Dict[str, Any]:
         """
         Jalankan semua pengecekan kualitas
@@ -66,26 +158,43 @@ class DataQualityChecker:
         self.recommendations = []
         
         # Run individual checks
-        self.check_completeness()
-        self.check_uniqueness()
-        self.check_consistency()
-        self.check_validity()
-        self.check_accuracy()
+        checks = [
+            self._check_completeness,
+            self._check_uniqueness,
+            self._check_consistency,
+            self._check_validity,
+            self._check_accuracy
+        ]
+        
+        # Pengecekan saling independen (read-only pada self.df), jadi untuk
+        # data besar dijalankan paralel; hasil digabung dengan urutan tetap
+        if len(self.df) >= QUALITY_CONFIG.get('parallel_min_rows', 100_000):
+            with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+                results = list(executor.map(lambda check: check(), checks))
+        else:
+            results = [check() for check in checks]
+        
+        for result in results:
+            self._merge_check(result)
         
         # Calculate overall score
         overall_score = self._calculate_overall_score()
         quality_level = self._determine_quality_level(overall_score)
         
+        # Hitung issue per severity dan per tipe dalam satu kali iterasi
+        severity_counts = Counter(i.severity for i in self.issues)
+        type_counts = Counter(i.issue_type for i in self.issues)
+        
         # Generate recommendations
-        self._generate_recommendations()
+        self._generate_recommendations(type_counts)
         
         result = {
             'overall_score': round(overall_score, 2),
             'quality_level': quality_level.value,
             'total_issues': len(self.issues),
-            'critical_issues': len([i for i in self.issues if i.severity == 'critical']),
-            'warning_issues': len([i for i in self.issues if i.severity == 'warning']),
-            'info_issues': len([i for i in self.issues if i.severity == 'info']),
+            'critical_issues': severity_counts['critical'],
+            'warning_issues': severity_counts['warning'],
+            'info_issues': severity_counts['info'],
             'scores': self.scores,
             'issues': self._issues_to_dict(),
             'recommendations': self.recommendations,
@@ -98,21 +207,46 @@ class DataQualityChecker:
     
     def check_completeness(self) -> None:
         """Cek kelengkapan data (null values)"""
+        self._merge_check(self._check_completeness())
+    
+    def check_uniqueness(self) -> None:
+        """Cek keunikan data (duplicates)"""
+        self._merge_check(self._check_uniqueness())
+    
+    def check_consistency(self) -> None:
+        """Cek konsistensi data"""
+        self._merge_check(self._check_consistency())
+    
+    def check_validity(self) -> None:
+        """Cek validitas data"""
+        self._merge_check(self._check_validity())
+    
+    def check_accuracy(self) -> None:
+        """Cek akurasi data"""
+        self._merge_check(self._check_accuracy())
+    
+    def _merge_check(self, result: Tuple[Dict[str, float], List[QualityIssue]]) -> None:
+        """Gabungkan hasil satu pengecekan ke scores dan issues"""
+        scores, issues = result
+        self.scores.update(scores)
+        self.issues.extend(issues)
+    
+    def _check_completeness(self) -> Tuple[Dict[str, float], List[QualityIssue]]:
+        """Cek kelengkapan data (null values)"""
+        scores: Dict[str, float] = {}
+        issues: List[QualityIssue] = []
+        
         if not QUALITY_CONFIG['check_nulls']:
-            return
+            return scores, issues
         
-        null_counts = self.df.isnull().sum()
+        # Hitung null per kolom langsung di NumPy, tanpa membuat Series
+        null_counts = self.df.isnull().to_numpy().sum(axis=0)
         total_rows = len(self.df)
         
-        completeness_scores = []
+        null_pcts = null_counts / total_rows if total_rows > 0 else np.zeros(len(null_counts))
+        completeness_scores = (1 - null_pcts) * 100
         
-        for col in self.df.columns:
-            null_count = null_counts[col]
-            null_pct = null_count / total_rows if total_rows > 0 else 0
-            
-            completeness = (1 - null_pct) * 100
-            completeness_scores.append(completeness)
-            
+        for col, null_count, null_pct in zip(self.df.columns, null_counts.tolist(), null_pcts.tolist()):
             if null_pct > QUALITY_CONFIG['null_threshold']:
                 severity = 'critical' if null_pct > 0.5 else 'warning'
                 
@@ -122,24 +256,31 @@ class DataQualityChecker:
                     severity=severity,
                     message=f"{null_count} null values ({null_pct*100:.2f}%)",
                     affected_rows=null_count,
-                    affected_indices=self.df[self.df[col].isnull()].index.tolist(),
+                    affected_indices=self._affected_indices(lambda col=col: self.df[col].isnull()),
                     suggestion=f"Consider filling null values in '{col}' or removing rows with missing data"
                 )
                 
-                self.issues.append(issue)
+                issues.append(issue)
+        
+        scores['completeness'] = float(np.mean(completeness_scores)) if len(completeness_scores) else 100
         
-        self.scores['completeness'] = np.mean(completeness_scores) if completeness_scores else 100
+        return scores, issues
     
-    def check_uniqueness(self) -> None:
+    def _check_uniqueness(self) -> Tuple[Dict[str, float], List[QualityIssue]]:
         """Cek keunikan data (duplicates)"""
+        scores: Dict[str, float] = {}
+        issues: List[QualityIssue] = []
+        
         if not QUALITY_CONFIG['check_duplicates']:
-            return
+            return scores, issues
         
         total_rows = len(self.df)
         
-        # Check full row duplicates
-        duplicate_mask = self.df.duplicated()
-        duplicate_count = duplicate_mask.sum()
+        # Cek duplikat hanya pada kolom kunci jika dikonfigurasi, selain itu seluruh baris
+        subset = [c for c in QUALITY_CONFIG.get('duplicate_subset') or [] if c in self.df.columns]
+        
+        duplicate_mask = self.df.duplicated(subset=subset or None).to_numpy()
+        duplicate_count = int(np.count_nonzero(duplicate_mask))
         duplicate_pct = duplicate_count / total_rows if total_rows > 0 else 0
         
         uniqueness = (1 - duplicate_pct) * 100
@@ -148,33 +289,36 @@ class DataQualityChecker:
             severity = 'critical' if duplicate_pct > 0.2 else 'warning'
             
             issue = QualityIssue(
-                column='all',
+                column=', '.join(map(str, subset)) if subset else 'all',
                 issue_type='uniqueness',
                 severity=severity,
                 message=f"{duplicate_count} duplicate rows ({duplicate_pct*100:.2f}%)",
                 affected_rows=duplicate_count,
-                affected_indices=self.df[duplicate_mask].index.tolist(),
+                affected_indices=self._affected_indices(duplicate_mask),
                 suggestion="Remove duplicate rows to improve data quality"
             )
             
-            self.issues.append(issue)
+            issues.append(issue)
         
-        self.scores['uniqueness'] = uniqueness
+        scores['uniqueness'] = uniqueness
+        
+        return scores, issues
     
-    def check_consistency(self) -> None:
+    def _check_consistency(self) -> Tuple[Dict[str, float], List[QualityIssue]]:
         """Cek konsistensi data"""
+        scores: Dict[str, float] = {}
+        issues: List[QualityIssue] = []
+        
         # Check for inconsistent formatting in string columns
-        for col in self.df.select_dtypes(include=['object']).columns:
+        for col in self._obj_cols:
             values = self.df[col].dropna().astype(str)
             
             if len(values) == 0:
                 continue
             
-            # Check for mixed case
-            upper_count = values.str.isupper().sum()
-            lower_count = values.str.islower().sum()
-            mixed_count = len(values) - upper_count - lower_count
+            upper_count, lower_count, mixed_count, whitespace_count = _scan_string_series(values)
             
+            # Check for mixed case
             if mixed_count > 0 and upper_count > 0 and lower_count > 0:
                 issue = QualityIssue(
                     column=col,
@@ -182,16 +326,12 @@ class DataQualityChecker:
                     severity='warning',
                     message=f"Mixed case formatting detected",
                     affected_rows=mixed_count,
-                    affected_indices=[],
                     suggestion=f"Standardize case formatting in '{col}'"
                 )
                 
-                self.issues.append(issue)
+                issues.append(issue)
             
             # Check for leading/trailing whitespace
-            whitespace_mask = values != values.str.strip()
-            whitespace_count = whitespace_mask.sum()
-            
             if whitespace_count > 0:
                 issue = QualityIssue(
                     column=col,
@@ -199,125 +339,215 @@ class DataQualityChecker:
                     severity='info',
                     message=f"{whitespace_count} values with leading/trailing whitespace",
                     affected_rows=whitespace_count,
-                    affected_indices=self.df[col].astype(str).str.strip() != self.df[col].astype(str).fillna('').index[whitespace_mask].tolist(),
+                    affected_indices=self._affected_indices(
+                        lambda: (values != values.str.strip()).to_numpy(dtype=bool), values.index
+                    ),
                     suggestion=f"Trim whitespace in '{col}'"
                 )
                 
-                self.issues.append(issue)
+                issues.append(issue)
+        
+        scores['consistency'] = 100 - len(issues) * 5
+        scores['consistency'] = max(0, scores['consistency'])
         
-        self.scores['consistency'] = 100 - len([i for i in self.issues if i.issue_type == 'consistency']) * 5
-        self.scores['consistency'] = max(0, self.scores['consistency'])
+        return scores, issues
     
-    def check_validity(self) -> None:
+    def _check_validity(self) -> Tuple[Dict[str, float], List[QualityIssue]]:
         """Cek validitas data"""
+        scores: Dict[str, float] = {}
+        issues: List[QualityIssue] = []
+        
         # Check phone numbers
         if QUALITY_CONFIG['validate_phone'] and 'Contact Number' in self.df.columns:
-            invalid_phones = []
-            
-            for idx, phone in self.df['Contact Number'].items():
-                if pd.notna(phone) and str(phone).strip() != '':
-                    if not validate_phone(str(phone)):
-                        invalid_phones.append(idx)
+            phone_mask = self._invalid_phone_mask(self.df['Contact Number'])
+            invalid_phones = int(phone_mask.sum())
             
             if invalid_phones:
                 issue = QualityIssue(
                     column='Contact Number',
                     issue_type='validity',
                     severity='warning',
-                    message=f"{len(invalid_phones)} invalid phone numbers",
-                    affected_rows=len(invalid_phones),
-                    affected_indices=invalid_phones,
+                    message=f"{invalid_phones} invalid phone numbers",
+                    affected_rows=invalid_phones,
+                    affected_indices=self._affected_indices(phone_mask),
                     suggestion="Validate and correct phone number format"
                 )
                 
-                self.issues.append(issue)
+                issues.append(issue)
         
         # Check dates
         if QUALITY_CONFIG['validate_dates'] and 'Date Created' in self.df.columns:
-            invalid_dates = []
-            
-            for idx, date in self.df['Date Created'].items():
-                if pd.notna(date) and str(date).strip() != '':
-                    parsed = parse_date(str(date))
-                    if parsed is None:
-                        invalid_dates.append(idx)
+            date_mask = self._invalid_date_mask(self.df['Date Created'])
+            invalid_dates = int(date_mask.sum())
             
             if invalid_dates:
                 issue = QualityIssue(
                     column='Date Created',
                     issue_type='validity',
                     severity='warning',
-                    message=f"{len(invalid_dates)} invalid dates",
-                    affected_rows=len(invalid_dates),
-                    affected_indices=invalid_dates,
+                    message=f"{invalid_dates} invalid dates",
+                    affected_rows=invalid_dates,
+                    affected_indices=self._affected_indices(date_mask),
                     suggestion="Validate and correct date format"
                 )
                 
-                self.issues.append(issue)
+                issues.append(issue)
         
         # Check SC Order No format
         if 'SC Order No/Track ID/CSRM No' in self.df.columns:
-            invalid_orders = []
-            
-            for idx, order in self.df['SC Order No/Track ID/CSRM No'].items():
-                order_str = clean_string(order, uppercase=True)
-                # Check if contains required patterns
-                if not any(pattern in order_str for pattern in ['AO', 'PDA', 'WSA', '-MO', '-DO']):
-                    invalid_orders.append(idx)
+            orders = self.df['SC Order No/Track ID/CSRM No'].astype('string').str.upper()
+            # Check if contains required patterns
+            valid_mask = orders.str.contains(ORDER_PATTERN, regex=True, na=False)
+            order_mask = ~valid_mask.to_numpy(dtype=bool)
+            invalid_orders = int(order_mask.sum())
             
             if invalid_orders:
                 issue = QualityIssue(
                     column='SC Order No/Track ID/CSRM No',
                     issue_type='validity',
                     severity='info',
-                    message=f"{len(invalid_orders)} orders without standard pattern",
-                    affected_rows=len(invalid_orders),
-                    affected_indices=invalid_orders,
+                    message=f"{invalid_orders} orders without standard pattern",
+                    affected_rows=invalid_orders,
+                    affected_indices=self._affected_indices(order_mask),
                     suggestion="Verify order number format"
                 )
                 
-                self.issues.append(issue)
+                issues.append(issue)
+        
+        scores['validity'] = 100 - len(issues) * 5
+        scores['validity'] = max(0, scores['validity'])
         
-        self.scores['validity'] = 100 - len([i for i in self.issues if i.issue_type == 'validity']) * 5
-        self.scores['validity'] = max(0, self.scores['validity'])
+        return scores, issues
     
-    def check_accuracy(self) -> None:
+    @staticmethod
+    def _invalid_phone_mask(series: pd.Series) -> np.ndarray:
+        """
+        Mask nomor telepon terisi yang tidak valid
+        
+        Args:
+            series: Kolom nomor telepon
+            
+        Returns:
+            Boolean array
+        """
+        s = series.astype('string').str.strip()
+        present = (s.notna() & (s != '')).to_numpy(dtype=bool, na_value=False)
+        
+        return present & ~validate_phone_array(series.to_numpy(dtype=object))
+    
+    @staticmethod
+    def _invalid_date_mask(series: pd.Series) -> np.ndarray:
+        """
+        Mask tanggal terisi yang tidak cocok dengan format yang didukung parse_date
+        
+        Args:
+            series: Kolom tanggal
+            
+        Returns:
+            Boolean array
+        """
+        # Kolom yang sudah bertipe datetime pasti valid, tidak perlu di-parse
+        if pd.api.types.is_datetime64_any_dtype(series):
+            return np.zeros(len(series), dtype=bool)
+        
+        s = series.astype('string').str.strip()
+        present = (s.notna() & (s != '')).to_numpy(dtype=bool, na_value=False)
+        
+        s = s.str.replace(r'\.0$', '', regex=True)
+        
+        # Parse hanya nilai unik, lalu petakan kembali ke seluruh kolom
+        uniques = pd.Series(s[present].unique(), dtype='string')
+        
+        # Coba setiap format sekali untuk semua nilai unik
+        unique_parsed = np.zeros(len(uniques), dtype=bool)
+        for fmt in DATE_FORMATS:
+            remaining = ~unique_parsed
+            if not remaining.any():
+                break
+            converted = pd.to_datetime(uniques[remaining], format=fmt, errors='coerce')
+            unique_parsed[remaining] = converted.notna().to_numpy()
+        
+        parsed = s.isin(uniques[unique_parsed]).to_numpy(dtype=bool, na_value=False)
+        
+        return present & ~parsed
+    
+    def _check_accuracy(self) -> Tuple[Dict[str, float], List[QualityIssue]]:
         """Cek akurasi data"""
+        scores: Dict[str, float] = {}
+        issues: List[QualityIssue] = []
+        
         # Check for suspicious values (outliers, etc.)
-        for col in self.df.select_dtypes(include=[np.number]).columns:
-            values = self.df[col].dropna()
-            
-            if len(values) < 10:
-                continue
+        arr = self.df[self._num_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+        
+        # Kolom dengan kurang dari 10 nilai dilewati
+        valid_counts = np.count_nonzero(~np.isnan(arr), axis=0)
+        keep = valid_counts >= 10
+        
+        if keep.any():
+            arr = arr[:, keep]
+            valid_counts = valid_counts[keep]
+            columns = [col for col, k in zip(self._num_cols, keep) if k]
             
-            # Simple outlier detection using IQR
-            q1 = values.quantile(0.25)
-            q3 = values.quantile(0.75)
+            # Simple outlier detection using IQR, kedua kuartil dalam satu panggilan
+            q1, q3 = np.nanpercentile(arr, [25, 75], axis=0)
             iqr = q3 - q1
             
             lower_bound = q1 - 1.5 * iqr
             upper_bound = q3 + 1.5 * iqr
             
-            outliers = values[(values < lower_bound) | (values > upper_bound)]
+            # Jumlah dan persentase outlier semua kolom sekaligus
+            outlier_mask = (arr < lower_bound) | (arr > upper_bound)
+            outlier_counts = np.count_nonzero(outlier_mask, axis=0)
+            outlier_pcts = outlier_counts / valid_counts * 100
             
-            if len(outliers) > 0:
-                outlier_pct = len(outliers) / len(values) * 100
+            # More than 10% outliers
+            for pos in np.flatnonzero(outlier_pcts > 10):
+                col = columns[pos]
+                outlier_count = int(outlier_counts[pos])
+                outlier_pct = float(outlier_pcts[pos])
+                
+                issue = QualityIssue(
+                    column=col,
+                    issue_type='accuracy',
+                    severity='warning',
+                    message=f"{outlier_count} potential outliers ({outlier_pct:.2f}%)",
+                    affected_rows=outlier_count,
+                    affected_indices=self._affected_indices(outlier_mask[:, pos]),
+                    suggestion=f"Review outliers in '{col}' for data accuracy"
+                )
                 
-                if outlier_pct > 10:  # More than 10% outliers
-                    issue = QualityIssue(
-                        column=col,
-                        issue_type='accuracy',
-                        severity='warning',
-                        message=f"{len(outliers)} potential outliers ({outlier_pct:.2f}%)",
-                        affected_rows=len(outliers),
-                        affected_indices=outliers.index.tolist(),
-                        suggestion=f"Review outliers in '{col}' for data accuracy"
-                    )
-                    
-                    self.issues.append(issue)
-        
-        self.scores['accuracy'] = 100 - len([i for i in self.issues if i.issue_type == 'accuracy']) * 5
-        self.scores['accuracy'] = max(0, self.scores['accuracy'])
+                issues.append(issue)
+        
+        scores['accuracy'] = 100 - len(issues) * 5
+        scores['accuracy'] = max(0, scores['accuracy'])
+        
+        return scores, issues
+    
+    def _affected_indices(self, mask, index: pd.Index = None) -> Optional[np.ndarray]:
+        """
+        Ambil index baris yang terdampak, hanya jika keep_indices aktif
+        
+        Args:
+            mask: Boolean mask, Index yang sudah terpilih, atau callable yang
+                  menghasilkan mask (dihitung hanya jika diperlukan)
+            index: Index acuan mask (default: index dataframe)
+            
+        Returns:
+            Array index atau None
+        """
+        if not QUALITY_CONFIG.get('keep_indices', False):
+            return None
+        
+        if callable(mask):
+            mask = mask()
+        
+        if isinstance(mask, pd.Index):
+            return mask.to_numpy()
+        
+        if index is None:
+            index = self.df.index
+        
+        return index[np.asarray(mask, dtype=bool)].to_numpy()
     
     def _calculate_overall_score(self) -> float:
         """Kalkulasi overall quality score"""
@@ -355,16 +585,18 @@ class DataQualityChecker:
         else:
             return QualityLevel.CRITICAL
     
-    def _generate_recommendations(self) -> None:
-        """Generate rekomendasi perbaikan"""
+    def _generate_recommendations(self, issues_by_type: Optional[Counter] = None) -> None:
+        """
+        Generate rekomendasi perbaikan
+        
+        Args:
+            issues_by_type: Jumlah issue per tipe (dihitung ulang jika None)
+        """
         self.recommendations = []
         
         # Group issues by type
-        issues_by_type = {}
-        for issue in self.issues:
-            if issue.issue_type not in issues_by_type:
-                issues_by_type[issue.issue_type] = []
-            issues_by_type[issue.issue_type].append(issue)
+        if issues_by_type is None:
+            issues_by_type = Counter(i.issue_type for i in self.issues)
         
         # Generate recommendations based on issue types
         if 'completeness' in issues_by_type:
@@ -445,14 +677,14 @@ class DataQualityChecker:
         """
         df = self.df.copy()
         
-        # Fix whitespace
-        for col in df.select_dtypes(include=['object']).columns:
-            df[col] = df[col].astype(str).str.strip()
+        # Fix whitespace (null tetap null, bukan string 'nan')
+        for col in self._obj_cols:
+            df[col] = df[col].astype('string').str.strip()
         
         # Fix phone numbers
         if 'Contact Number' in df.columns:
-            df['Contact Number'] = df['Contact Number'].apply(
-                lambda x: re.sub(r'\D', '', str(x)) if pd.notna(x) else x
+            df['Contact Number'] = df['Contact Number'].astype('string').str.replace(
+                r'\D', '', regex=True
             )
         
         # Remove exact duplicates
@@ -476,6 +708,23 @@ class QualityReport:
             checker: Instance DataQualityChecker
         """
         self.checker = checker
+        self._result: Optional[Dict[str, Any]] = None
+        self._result_key: Optional[Tuple[int, int]] = None
+    
+    def _get_result(self) -> Dict[str, Any]:
+        """
+        Ambil hasil run_all_checks, dijalankan ulang hanya jika data checker berubah
+        
+        Returns:
+            Dictionary hasil pengecekan
+        """
+        key = (id(self.checker.df), len(self.checker.df))
+        
+        if self._result is None or self._result_key != key:
+            self._result = self.checker.run_all_checks()
+            self._result_key = key
+        
+        return self._result
     
     def generate_summary_card(self) -> Dict[str, Any]:
         """
@@ -484,7 +733,7 @@ class QualityReport:
         Returns:
             Dictionary summary
         """
-        result = self.checker.run_all_checks()
+        result = self._get_result()
         
         # Determine color based on score
         score = result['overall_score']
@@ -514,7 +763,7 @@ class QualityReport:
         Returns:
             String laporan
         """
-        result = self.checker.run_all_checks()
+        result = self._get_result()
         
         report = f"""
 {'='*60}
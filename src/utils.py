@@ -7,22 +7,73 @@ import os
 import re
 import io
 import json
+import queue
+import atexit
 import logging
+import logging.handlers
 import hashlib
+import functools
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Tuple, Union
+from typing import Dict, List, Any, Optional, Tuple, Union, Iterator
 import pandas as pd
 import numpy as np
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+except ImportError:  # pragma: no cover - pyarrow opsional
+    pa = pc = pacsv = None
+
+try:
+    import polars as pl
+except ImportError:  # pragma: no cover - polars opsional
+    pl = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson opsional
+    orjson = None
+
 from config.settings import (
     LOG_CONFIG, BULAN_INDONESIA, BULAN_SINGKAT,
     ERROR_MESSAGES, SUCCESS_MESSAGES, EXPORT_CONFIG
 )
 
 
+# Nilai EXPORT_CONFIG yang dipakai setiap export (dibaca sekali saat import)
+_EXCEL_ENGINE = EXPORT_CONFIG['excel_engine']
+_CSV_ENC = EXPORT_CONFIG['csv_encoding']
+
+
+# Regex yang dipakai berulang di fungsi-fungsi kecil (compile sekali)
+_NON_DIGIT = re.compile(r'\D')
+_TRAIL_ZERO = re.compile(r'\.0$')  # Suffix '.0' dari angka yang terbaca sebagai float
+
+
 # ==========================================
 # LOGGER SETUP
 # ==========================================
+# Listener yang menulis log di thread terpisah (satu per nama logger)
+_log_listeners: Dict[str, logging.handlers.QueueListener] = {}
+
+
+def _stop_log_listener(name: str) -> None:
+    """Hentikan listener log milik logger `name` dan tulis sisa antreannya"""
+    listener = _log_listeners.pop(name, None)
+    if listener is not None:
+        listener.stop()
+
+
+def _stop_all_log_listeners() -> None:
+    """Hentikan semua listener log (dipanggil saat proses selesai)"""
+    for name in list(_log_listeners):
+        _stop_log_listener(name)
+
+
+atexit.register(_stop_all_log_listeners)
+
+
 def setup_logger(name: str = "WSA_APP") -> logging.Logger:
     """
     Setup logger dengan konfigurasi yang fleksibel
@@ -38,6 +89,8 @@ def setup_logger(name: str = "WSA_APP") -> logging.Logger:
     
     # Clear existing handlers
     logger.handlers = []
+    _stop_log_listener(name)
+    handlers = []
     
     # Format
     formatter = logging.Formatter(
@@ -51,21 +104,30 @@ def setup_logger(name: str = "WSA_APP") -> logging.Logger:
         os.makedirs(log_dir, exist_ok=True)
         log_path = os.path.join(log_dir, LOG_CONFIG["log_file"])
         
-        from logging.handlers import RotatingFileHandler
-        file_handler = RotatingFileHandler(
+        file_handler = logging.handlers.RotatingFileHandler(
             log_path,
             maxBytes=LOG_CONFIG["max_file_size"],
             backupCount=LOG_CONFIG["backup_count"],
             encoding='utf-8'
         )
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
     
     # Console Handler
     if LOG_CONFIG["console_output"]:
         console_handler = logging.StreamHandler()
         console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
+    
+    # Logger hanya memasukkan record ke antrean; tulis ke file/console
+    # dilakukan listener di background agar tidak menahan thread pemanggil
+    if handlers:
+        log_queue = queue.SimpleQueue()
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        
+        listener = logging.handlers.QueueListener(log_queue, *handlers)
+        listener.start()
+        _log_listeners[name] = listener
     
     return logger
 
@@ -77,6 +139,18 @@ logger = setup_logger()
 # ==========================================
 # DATE & TIME UTILITIES
 # ==========================================
+# Format tanggal yang didukung parse_date (urutan = prioritas)
+DATE_FORMATS = (
+    '%Y-%m-%d %H:%M:%S',
+    '%d/%m/%Y %H:%M:%S',
+    '%d/%m/%Y %H:%M',
+    '%m/%d/%Y %H:%M:%S',
+    '%Y-%m-%d',
+    '%d/%m/%Y',
+    '%m/%d/%Y'
+)
+
+
 def parse_date(date_str: str, formats: List[str] = None) -> Optional[datetime]:
     """
     Parse tanggal dari berbagai format
@@ -88,24 +162,28 @@ def parse_date(date_str: str, formats: List[str] = None) -> Optional[datetime]:
     Returns:
         datetime object atau None
     """
-    if formats is None:
-        formats = [
-            '%Y-%m-%d %H:%M:%S',
-            '%d/%m/%Y %H:%M:%S',
-            '%d/%m/%Y %H:%M',
-            '%m/%d/%Y %H:%M:%S',
-            '%Y-%m-%d',
-            '%d/%m/%Y',
-            '%m/%d/%Y'
-        ]
-    
     if pd.isna(date_str) or str(date_str).strip() == '':
         return None
     
     date_str = str(date_str).strip()
     
+    # Format default: hasil di-cache karena tanggal sering berulang
+    if formats is None:
+        return _parse_date_cached(date_str)
+    
+    return _parse_date_formats(date_str, formats)
+
+
+@functools.lru_cache(maxsize=65536)
+def _parse_date_cached(date_str: str) -> Optional[datetime]:
+    """Parse tanggal dengan DATE_FORMATS (di-cache per string)"""
+    return _parse_date_formats(date_str, DATE_FORMATS)
+
+
+def _parse_date_formats(date_str: str, formats: Tuple[str, ...]) -> Optional[datetime]:
+    """Coba parse string (sudah di-strip) dengan setiap format secara berurutan"""
     # Remove .0 suffix
-    date_str = re.sub(r'\.0$', '', date_str)
+    date_str = _TRAIL_ZERO.sub('', date_str)
     
     for fmt in formats:
         try:
@@ -116,6 +194,49 @@ def parse_date(date_str: str, formats: List[str] = None) -> Optional[datetime]:
     return None
 
 
+def parse_date_series(values: Union[pd.Series, List[Any]],
+                      formats: Tuple[str, ...] = None) -> pd.Series:
+    """
+    Parse kolom tanggal secara vektor (hasil sama dengan apply(parse_date))
+    
+    Setiap format dicoba sekali dengan pd.to_datetime(format=..., cache=True)
+    hanya pada nilai yang belum ter-parse, sehingga pandas tidak perlu
+    menebak format per nilai.
+    
+    Args:
+        values: Series atau list string tanggal
+        formats: Format yang didukung (default: DATE_FORMATS)
+        
+    Returns:
+        Series datetime (NaT untuk nilai kosong/tidak valid)
+    """
+    if formats is None:
+        formats = DATE_FORMATS
+    
+    if not isinstance(values, pd.Series):
+        values = pd.Series(values, dtype=object)
+    
+    # Kolom yang sudah bertipe datetime tidak perlu di-parse lagi
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values.copy()
+    
+    s = values.astype('string').str.strip().str.replace(r'\.0$', '', regex=True)
+    remaining = (s.notna() & (s != '')).to_numpy(dtype=bool, na_value=False)
+    
+    result = np.full(len(s), np.datetime64('NaT'), dtype='datetime64[us]')
+    
+    for fmt in formats:
+        if not remaining.any():
+            break
+        pos = np.flatnonzero(remaining)
+        parsed = pd.to_datetime(s.iloc[pos], format=fmt, errors='coerce', cache=True)
+        ok = parsed.notna().to_numpy()
+        result[pos[ok]] = parsed[ok].to_numpy(dtype='datetime64[us]')
+        remaining[pos[ok]] = False
+    
+    return pd.Series(result, index=values.index, name=values.name)
+
+
 def format_date(date_obj: datetime, format_str: str = '%d/%m/%Y %H:%M') -> str:
     """
     Format datetime ke string
@@ -184,7 +305,7 @@ def clean_string(val: Any, uppercase: bool = False, strip: bool = True) -> str:
         result = result.strip()
     
     # Remove .0 suffix for numbers
-    result = re.sub(r'\.0$', '', result)
+    result = _TRAIL_ZERO.sub('', result)
     
     if uppercase:
         result = result.upper()
@@ -192,6 +313,29 @@ def clean_string(val: Any, uppercase: bool = False, strip: bool = True) -> str:
     return result
 
 
+def clean_string_series(values: Union[pd.Series, List], uppercase: bool = False) -> pd.Series:
+    """
+    Bersihkan banyak string sekaligus (versi vektor dari clean_string)
+    
+    Args:
+        values: Kumpulan value yang akan dibersihkan
+        uppercase: Konversi ke uppercase
+        
+    Returns:
+        Series string (null menjadi '')
+    """
+    s = values if isinstance(values, pd.Series) else pd.Series(values, dtype=object)
+    
+    # str() per nilai agar representasi sama dengan clean_string (misal float 7.0 -> '7.0')
+    result = s.astype(object).where(s.isna(), s.astype(str)).astype('string')
+    result = result.str.strip().str.replace(_TRAIL_ZERO, '', regex=True)
+    
+    if uppercase:
+        result = result.str.upper()
+    
+    return result.fillna('').astype(str)
+
+
 def normalize_phone(phone: str) -> str:
     """
     Normalisasi nomor telepon
@@ -208,7 +352,7 @@ def normalize_phone(phone: str) -> str:
     phone = clean_string(phone)
     
     # Remove non-digit characters
-    phone = re.sub(r'\D', '', phone)
+    phone = _NON_DIGIT.sub('', phone)
     
     # Format Indonesia
     if phone.startswith('0'):
@@ -219,6 +363,25 @@ def normalize_phone(phone: str) -> str:
     return phone
 
 
+def normalize_phone_series(values: Union[pd.Series, List]) -> pd.Series:
+    """
+    Normalisasi banyak nomor telepon sekaligus (versi vektor dari normalize_phone)
+    
+    Args:
+        values: Kumpulan nomor telepon
+        
+    Returns:
+        Series nomor telepon yang sudah dinormalisasi
+    """
+    phone = clean_string_series(values).str.replace(_NON_DIGIT, '', regex=True)
+    
+    # Format Indonesia
+    phone = phone.mask(phone.str.startswith('0'), '62' + phone.str[1:])
+    phone = phone.mask(phone.str.startswith('8'), '62' + phone)
+    
+    return phone
+
+
 def validate_phone(phone: str) -> bool:
     """
     Validasi format nomor telepon Indonesia
@@ -242,6 +405,29 @@ def validate_phone(phone: str) -> bool:
     return True
 
 
+def validate_phone_array(values: Union[pd.Series, np.ndarray, List]) -> np.ndarray:
+    """
+    Validasi banyak nomor telepon sekaligus (versi vektor dari validate_phone)
+    
+    Args:
+        values: Kumpulan nomor telepon
+        
+    Returns:
+        Boolean array, True jika valid
+    """
+    s = pd.Series(values, dtype=object).astype('string').str.strip()
+    
+    digits = s.str.replace(_TRAIL_ZERO, '', regex=True).str.replace(_NON_DIGIT, '', regex=True)
+    
+    # Format Indonesia: 0xxx -> 62xxx, 8xxx -> 628xxx
+    digits = digits.mask(digits.str.startswith('0', na=False), '62' + digits.str[1:])
+    digits = digits.mask(digits.str.startswith('8', na=False), '62' + digits)
+    
+    valid = digits.str.len().between(10, 15) & digits.str.startswith('62', na=False)
+    
+    return valid.to_numpy(dtype=bool, na_value=False)
+
+
 def extract_order_id(text: str) -> str:
     """
     Extract order ID dari string
@@ -264,6 +450,9 @@ def extract_order_id(text: str) -> str:
 # ==========================================
 # DATAFRAME UTILITIES
 # ==========================================
+# Nilai yang dianggap null saat membersihkan dataframe
+NULL_VALUES = ['', 'nan', 'NaN', 'NULL', 'null', 'None', 'none', '-']
+
 def clean_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     """
     Bersihkan dataframe dari nilai-nilai tidak valid
@@ -277,12 +466,22 @@ def clean_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     df = df.copy()
     
     # Replace common null values
-    null_values = ['', 'nan', 'NaN', 'NULL', 'null', 'None', 'none', '-']
-    df = df.replace(null_values, np.nan)
-    
-    # Clean string columns
-    for col in df.select_dtypes(include=['object']).columns:
-        df[col] = df[col].apply(lambda x: clean_string(x))
+    df = df.replace(NULL_VALUES, np.nan)
+    
+    # Clean string columns (setara clean_string, tapi per kolom); kolom 'str'
+    # bawaan pandas 3 juga termasuk, bukan hanya object
+    string_cols = [
+        col for col in df.columns
+        if df[col].dtype == object or pd.api.types.is_string_dtype(df[col])
+    ]
+    for col in string_cols:
+        df[col] = (
+            df[col].astype('string')
+            .str.strip()
+            .str.replace(_TRAIL_ZERO, '', regex=True)
+            .fillna('')
+            .astype(str)
+        )
     
     return df
 
@@ -349,33 +548,129 @@ def get_column_stats(df: pd.DataFrame) -> Dict[str, Any]:
 # ==========================================
 # EXPORT UTILITIES
 # ==========================================
+def _is_polars(df: Any) -> bool:
+    """Cek apakah df adalah DataFrame polars (diexport tanpa konversi ke pandas)"""
+    return pl is not None and isinstance(df, pl.DataFrame)
+
+
+def _column_widths(df: pd.DataFrame, max_width: int = 50) -> List[int]:
+    """
+    Estimasi lebar kolom Excel dari sampel baris awal
+    
+    Args:
+        df: DataFrame yang akan diexport
+        max_width: Lebar maksimum kolom
+        
+    Returns:
+        List lebar per kolom (urutan sama dengan df.columns)
+    """
+    sample = df.head(EXPORT_CONFIG['autofit_sample_rows'])
+    
+    widths = []
+    for i, col in enumerate(df.columns):
+        lengths = sample.iloc[:, i].astype(str).str.len()
+        # Kolom kosong/semua null: max() bernilai NaN
+        longest = lengths.max()
+        max_length = max(int(longest) if pd.notna(longest) else 0, len(str(col))) + 2
+        widths.append(min(max_length, max_width))
+    
+    return widths
+
+
 def export_to_excel(df: pd.DataFrame, filename: str = None) -> bytes:
     """
     Export dataframe ke Excel
     
     Args:
-        df: DataFrame yang akan diexport
+        df: DataFrame pandas atau polars yang akan diexport
         filename: Nama file (opsional)
         
     Returns:
         Bytes data Excel
     """
-    if filename is None:
-        filename = f"{EXPORT_CONFIG['filename_prefix']}_{datetime.now().strftime(EXPORT_CONFIG['date_format'])}.xlsx"
+    if _is_polars(df):
+        buffer = io.BytesIO()
+        df.write_excel(workbook=buffer, worksheet='Data', autofit=True)
+        return buffer.getvalue()
+    
+    # Data besar ditulis baris per baris agar memori tidak ikut membengkak
+    if len(df) >= EXPORT_CONFIG['streaming_min_rows']:
+        return _export_to_excel_streaming(df)
     
     buffer = io.BytesIO()
     
-    with pd.ExcelWriter(buffer, engine=EXPORT_CONFIG['excel_engine']) as writer:
+    # xlsxwriter secara default mencocokkan setiap string dengan regex URL;
+    # data export tidak berisi hyperlink sehingga pengecekan ini dimatikan
+    engine_kwargs = {}
+    if _EXCEL_ENGINE == 'xlsxwriter':
+        engine_kwargs = {'options': {'strings_to_urls': False}}
+    
+    with pd.ExcelWriter(buffer, engine=_EXCEL_ENGINE, engine_kwargs=engine_kwargs) as writer:
         df.to_excel(writer, index=False, sheet_name='Data')
         
         # Auto-adjust column widths
         worksheet = writer.sheets['Data']
-        for i, col in enumerate(df.columns):
-            max_length = max(
-                df[col].astype(str).map(len).max(),
-                len(str(col))
-            ) + 2
-            worksheet.set_column(i, i, min(max_length, 50))
+        for i, width in enumerate(_column_widths(df)):
+            worksheet.set_column(i, i, width)
+    
+    return buffer.getvalue()
+
+
+def export_to_excel_segmented(df: pd.DataFrame, rows_per_file: int = None) -> Iterator[Tuple[str, bytes]]:
+    """
+    Export dataframe besar ke beberapa file Excel (satu file per segmen)
+    
+    Args:
+        df: DataFrame yang akan diexport
+        rows_per_file: Jumlah baris per file (default: EXPORT_CONFIG['segment_rows'])
+        
+    Returns:
+        Iterator tuple (nama_file, bytes data Excel)
+    """
+    if rows_per_file is None:
+        rows_per_file = EXPORT_CONFIG['segment_rows']
+    
+    base = f"{EXPORT_CONFIG['filename_prefix']}_{datetime.now().strftime(EXPORT_CONFIG['date_format'])}"
+    
+    # Minimal satu file walaupun data kosong
+    for part, start in enumerate(range(0, max(len(df), 1), rows_per_file), 1):
+        chunk = df.iloc[start:start + rows_per_file]
+        yield f"{base}_part{part}.xlsx", export_to_excel(chunk)
+
+
+def _export_to_excel_streaming(df: pd.DataFrame) -> bytes:
+    """
+    Export dataframe ke Excel dengan workbook write-only openpyxl
+    
+    Args:
+        df: DataFrame yang akan diexport
+        
+    Returns:
+        Bytes data Excel
+    """
+    from openpyxl import Workbook
+    from openpyxl.utils import get_column_letter
+    
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet('Data')
+    
+    # Lebar kolom harus diset sebelum baris pertama ditulis
+    for i, width in enumerate(_column_widths(df), 1):
+        ws.column_dimensions[get_column_letter(i)].width = width
+    
+    ws.append([str(col) for col in df.columns])
+    
+    # NaN/NaT/NA ditulis sebagai sel kosong; konversi ke object per blok
+    # agar salinan data tidak sebesar seluruh DataFrame
+    append = ws.append
+    for start in range(0, len(df), 10_000):
+        block = df.iloc[start:start + 10_000]
+        values = block.astype(object).where(block.notna(), None)
+        for row in values.itertuples(index=False, name=None):
+            append(row)
+    
+    buffer = io.BytesIO()
+    wb.save(buffer)
     
     return buffer.getvalue()
 
@@ -385,43 +680,185 @@ def export_to_csv(df: pd.DataFrame, filename: str = None) -> bytes:
     Export dataframe ke CSV
     
     Args:
-        df: DataFrame yang akan diexport
+        df: DataFrame pandas atau polars yang akan diexport
         filename: Nama file (opsional)
         
     Returns:
         Bytes data CSV
     """
-    if filename is None:
-        filename = f"{EXPORT_CONFIG['filename_prefix']}_{datetime.now().strftime(EXPORT_CONFIG['date_format'])}.csv"
+    encoding = _CSV_ENC
+    
+    if _is_polars(df):
+        buffer = io.BytesIO()
+        df.write_csv(buffer, include_bom=encoding.lower().endswith('sig'))
+        
+        # Polars selalu menulis UTF-8
+        if encoding.lower().replace('_', '-') in ('utf-8', 'utf-8-sig'):
+            return buffer.getvalue()
+        return buffer.getvalue().decode('utf-8').encode(encoding)
+    
+    # Arrow hanya menulis UTF-8 dengan baris '\n'; encoding lain tetap lewat
+    # pandas. Frame satu kolom juga lewat pandas karena baris kosong ditulis '""'
+    if (pa is not None and encoding.lower().replace('_', '-') in ('utf-8', 'utf-8-sig')
+            and os.linesep == '\n' and len(df.columns) > 1):
+        try:
+            data = _export_to_csv_arrow(df)
+            return (b'\xef\xbb\xbf' + data) if encoding.lower().endswith('sig') else data
+        except pa.ArrowException as e:
+            # Kolom campuran yang tidak bisa dikonversi ke Arrow
+            logger.debug(f"Arrow CSV export fallback to pandas: {e}")
     
     buffer = io.StringIO()
-    df.to_csv(buffer, index=False, encoding=EXPORT_CONFIG['csv_encoding'])
+    df.to_csv(buffer, index=False, encoding=encoding)
     
-    return buffer.getvalue().encode(EXPORT_CONFIG['csv_encoding'])
+    return buffer.getvalue().encode(encoding)
 
 
-def export_to_json(df: pd.DataFrame, filename: str = None) -> bytes:
+def _export_to_csv_arrow(df: pd.DataFrame) -> bytes:
     """
-    Export dataframe ke JSON
+    Tulis dataframe ke CSV (UTF-8) lewat pyarrow.csv, byte-identik dengan pandas
+    
+    Kolom integer dan string ditulis langsung oleh Arrow; kolom lain
+    (float, bool, tanggal, dll) diformat dengan astype(str) seperti
+    df.to_csv(). Arrow tidak punya quoting minimal, jadi nilai/header yang
+    perlu di-quote membuat write_csv gagal (ArrowInvalid) dan pemanggil
+    kembali ke pandas.
     
     Args:
         df: DataFrame yang akan diexport
+        
+    Returns:
+        Bytes data CSV tanpa BOM
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    
+    for i, field in enumerate(table.schema):
+        t = field.type
+        if pa.types.is_integer(t) or pa.types.is_string(t) or pa.types.is_large_string(t) or pa.types.is_null(t):
+            continue
+        
+        column = df.iloc[:, i]
+        formatted = column.astype(str).to_numpy(dtype=object)
+        formatted[column.isna().to_numpy()] = None
+        table = table.set_column(i, field.name, pa.array(formatted, type=pa.string()))
+    
+    sink = pa.BufferOutputStream()
+    pacsv.write_csv(table, sink, pacsv.WriteOptions(quoting_style='none', quoting_header='none'))
+    
+    return sink.getvalue().to_pybytes()
+
+
+def export_to_json(df: pd.DataFrame, filename: str = None, lines: bool = False) -> bytes:
+    """
+    Export dataframe ke JSON
+    
+    Args:
+        df: DataFrame pandas atau polars yang akan diexport
         filename: Nama file (opsional)
+        lines: True untuk format NDJSON (satu record per baris)
         
     Returns:
         Bytes data JSON
     """
-    if filename is None:
-        filename = f"{EXPORT_CONFIG['filename_prefix']}_{datetime.now().strftime(EXPORT_CONFIG['date_format'])}.json"
+    if _is_polars(df):
+        buffer = io.BytesIO()
+        if lines:
+            df.write_ndjson(buffer)
+        else:
+            df.write_json(buffer)
+        return buffer.getvalue()
+    
+    if pa is not None and orjson is not None:
+        try:
+            return _export_to_json_arrow(df, lines)
+        except (pa.ArrowException, TypeError) as e:
+            # Kolom campuran yang tidak bisa dikonversi ke Arrow
+            logger.debug(f"Arrow JSON export fallback to pandas: {e}")
     
-    json_str = df.to_json(orient='records', date_format='iso')
+    json_str = df.to_json(orient='records', date_format='iso', lines=lines)
     
     return json_str.encode('utf-8')
 
 
+def _export_to_json_arrow(df: pd.DataFrame, lines: bool) -> bytes:
+    """
+    Serialisasi dataframe ke JSON lewat tabel Arrow dan orjson
+    
+    Args:
+        df: DataFrame yang akan diexport
+        lines: True untuk format NDJSON
+        
+    Returns:
+        Bytes data JSON
+    """
+    # Tanggal ditulis dengan format ISO yang sama dengan pandas
+    # (presisi milidetik, zona waktu dikonversi ke UTC dengan akhiran 'Z')
+    datetime_cols = [
+        i for i in range(df.shape[1]) if pd.api.types.is_datetime64_any_dtype(df.iloc[:, i])
+    ]
+    if datetime_cols:
+        df = df.copy(deep=False)
+        for i in datetime_cols:
+            column = df.iloc[:, i]
+            suffix = ''
+            if column.dt.tz is not None:
+                column = column.dt.tz_convert('UTC').dt.tz_localize(None)
+                suffix = 'Z'
+            formatted = column.dt.strftime('%Y-%m-%dT%H:%M:%S.%f').str[:-3] + suffix
+            df.isetitem(i, formatted.astype(object).where(column.notna(), None))
+    
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    
+    # Tipe waktu lain (date, time, duration) diserialisasi berbeda oleh
+    # orjson; serahkan ke pandas agar format tetap konsisten
+    for field in table.schema:
+        if pa.types.is_temporal(field.type):
+            raise TypeError(f"Column '{field.name}' has temporal type {field.type}")
+    
+    if not lines:
+        return orjson.dumps(table.to_pylist(), option=orjson.OPT_SERIALIZE_NUMPY)
+    
+    # NDJSON ditulis per batch agar tidak membangun satu list besar
+    buffer = io.BytesIO()
+    for batch in table.to_batches():
+        for record in batch.to_pylist():
+            buffer.write(orjson.dumps(record, option=orjson.OPT_SERIALIZE_NUMPY))
+            buffer.write(b'\n')
+    
+    return buffer.getvalue()
+
+
+def export_to_parquet(df: pd.DataFrame, filename: str = None, compression: str = 'zstd') -> bytes:
+    """
+    Export dataframe ke Parquet (kolumnar, terkompresi, tipe data tetap terjaga
+    tidak seperti CSV/JSON yang menjadikan semua nilai teks)
+    
+    Args:
+        df: DataFrame pandas atau polars yang akan diexport
+        filename: Nama file (opsional)
+        compression: Algoritma kompresi ('zstd', 'snappy', 'gzip', None)
+        
+    Returns:
+        Bytes data Parquet
+    """
+    buffer = io.BytesIO()
+    
+    if _is_polars(df):
+        df.write_parquet(buffer, compression=compression or 'uncompressed')
+        return buffer.getvalue()
+    
+    df.to_parquet(buffer, engine='pyarrow', compression=compression, index=False)
+    
+    return buffer.getvalue()
+
+
 # ==========================================
 # VALIDATION UTILITIES
 # ==========================================
+# Ekstensi file upload yang diizinkan secara default
+_ALLOWED_EXTS = frozenset({'.xlsx', '.xls', '.csv'})
+
+
 def validate_file_extension(filename: str, allowed_extensions: List[str] = None) -> bool:
     """
     Validasi ekstensi file
@@ -433,10 +870,18 @@ def validate_file_extension(filename: str, allowed_extensions: List[str] = None)
     Returns:
         True jika valid
     """
+    # Sama dengan os.path.splitext: titik harus ada di nama file (bukan folder)
+    # dan titik di awal nama file (mis. '.csv') bukan ekstensi
+    start = max(filename.rfind('/'), filename.rfind(os.sep)) + 1
+    dot = filename.rfind('.')
+    if dot <= start or not filename[start:dot].lstrip('.'):
+        return False
+    
+    ext = filename[dot:].lower()
+    
     if allowed_extensions is None:
-        allowed_extensions = ['.xlsx', '.xls', '.csv']
+        allowed_extensions = _ALLOWED_EXTS
     
-    ext = os.path.splitext(filename.lower())[1]
     return ext in allowed_extensions
 
 
@@ -451,7 +896,8 @@ def validate_required_columns(df: pd.DataFrame, required_cols: List[str]) -> Tup
     Returns:
         Tuple (is_valid, missing_columns)
     """
-    missing = [col for col in required_cols if col not in df.columns]
+    cols_set = set(df.columns)
+    missing = [col for col in required_cols if col not in cols_set]
     return len(missing) == 0, missing
 
 
@@ -471,6 +917,27 @@ def generate_hash(data: str) -> str:
     return hashlib.sha256(data.encode()).hexdigest()
 
 
+def generate_hashes(items: List[str], algorithm: str = 'sha256') -> List[str]:
+    """
+    Generate hash untuk banyak string sekaligus
+    
+    Args:
+        items: List string yang akan di-hash
+        algorithm: Nama algoritma hashlib (misal 'sha256', 'blake2b')
+        
+    Returns:
+        List hash string (urutan sama dengan items)
+    """
+    # Lookup constructor cukup sekali untuk seluruh item
+    hasher = getattr(hashlib, algorithm)
+    
+    return [hasher(item.encode()).hexdigest() for item in items]
+
+
+# Deretan '*' siap pakai untuk masking (di-slice sesuai panjang)
+_STARS = '*' * 256
+
+
 def mask_sensitive_data(data: str, visible_chars: int = 4) -> str:
     """
     Masking data sensitif
@@ -482,40 +949,95 @@ def mask_sensitive_data(data: str, visible_chars: int = 4) -> str:
     Returns:
         Data yang sudah di-mask
     """
-    if len(data) <= visible_chars:
-        return '*' * len(data)
+    n = len(data)
+    hidden = n if n <= visible_chars else n - visible_chars
+    stars = _STARS[:hidden] if hidden <= len(_STARS) else '*' * hidden
     
-    return data[:visible_chars] + '*' * (len(data) - visible_chars)
+    if n <= visible_chars:
+        return stars
+    
+    return data[:visible_chars] + stars
+
+
+def mask_series(s: pd.Series, visible_chars: int = 4) -> pd.Series:
+    """
+    Masking data sensitif untuk satu kolom sekaligus (versi vektor dari mask_sensitive_data)
+    
+    Args:
+        s: Series yang akan di-mask
+        visible_chars: Jumlah karakter yang tetap terlihat
+        
+    Returns:
+        Series yang sudah di-mask (null tetap null)
+    """
+    text = s.astype('string')
+    lengths = text.str.len()
+    
+    # Panjang bagian yang di-mask; string bintang dibuat sekali per panjang unik
+    hidden = lengths.where(lengths <= visible_chars, lengths - visible_chars)
+    stars = hidden.map({k: '*' * k for k in hidden.dropna().unique().tolist()})
+    
+    head = text.str.slice(0, visible_chars).where(lengths > visible_chars, '')
+    
+    return head + stars.astype('string')
 
 
 # ==========================================
 # PERFORMANCE UTILITIES
 # ==========================================
-def chunk_list(lst: List, chunk_size: int) -> List[List]:
+def chunk_list(lst: List, chunk_size: int) -> Iterator[List]:
     """
-    Bagi list menjadi chunk
+    Bagi list menjadi chunk (generator, chunk dibuat satu per satu)
     
     Args:
         lst: List yang akan di-chunk
         chunk_size: Ukuran setiap chunk
         
     Returns:
-        List of chunks
+        Iterator of chunks
     """
-    return [lst[i:i + chunk_size] for i in range(0, len(lst), chunk_size)]
+    for i in range(0, len(lst), chunk_size):
+        yield lst[i:i + chunk_size]
 
 
-def memory_usage(df: pd.DataFrame) -> str:
+def chunk_array(arr: np.ndarray, chunk_size: int) -> Iterator[np.ndarray]:
+    """
+    Bagi array NumPy menjadi chunk berupa view (tanpa copy data)
+    
+    Args:
+        arr: Array yang akan di-chunk
+        chunk_size: Ukuran setiap chunk
+        
+    Returns:
+        Iterator of array views
+    """
+    for i in range(0, len(arr), chunk_size):
+        yield arr[i:i + chunk_size]
+
+
+def memory_usage(df: pd.DataFrame, exact: bool = False) -> str:
     """
     Dapatkan penggunaan memory dataframe
     
     Args:
         df: DataFrame input
+        exact: True untuk menghitung ukuran setiap string (lambat untuk data teks besar)
         
     Returns:
         String penggunaan memory
     """
-    mem = df.memory_usage(deep=True).sum()
+    if exact:
+        mem = df.memory_usage(deep=True).sum()
+    else:
+        mem = df.memory_usage(deep=False).sum()
+        
+        # Kolom object: estimasi ukuran string dari sampel
+        # (49 byte = overhead header objek str di CPython)
+        for i in np.flatnonzero((df.dtypes == object).to_numpy()):
+            col = df.iloc[:, i]
+            avg_len = col.head(1024).astype(str).str.len().mean()
+            if not pd.isna(avg_len):
+                mem += len(col) * (avg_len + 49)
     
     for unit in ['B', 'KB', 'MB', 'GB']:
         if mem < 1024:
@@ -528,6 +1050,16 @@ def memory_usage(df: pd.DataFrame) -> str:
 # ==========================================
 # NOTIFICATION UTILITIES
 # ==========================================
+# Ikon per tipe notifikasi (dibuat sekali saat import)
+_ICONS = {
+    'info': 'ℹ️',
+    'success': '✅',
+    'warning': '⚠️',
+    'error': '❌'
+}
+_DEFAULT_ICON = _ICONS['info']
+
+
 def create_notification(message: str, type_: str = 'info') -> Dict[str, str]:
     """
     Buat notifikasi
@@ -539,17 +1071,10 @@ def create_notification(message: str, type_: str = 'info') -> Dict[str, str]:
     Returns:
         Dictionary notifikasi
     """
-    icons = {
-        'info': 'ℹ️',
-        'success': '✅',
-        'warning': '⚠️',
-        'error': '❌'
-    }
-    
     return {
         'message': message,
         'type': type_,
-        'icon': icons.get(type_, 'ℹ️'),
+        'icon': _ICONS.get(type_, _DEFAULT_ICON),
         'timestamp': datetime.now().isoformat()
     }
 
@@ -566,9 +1091,9 @@ def init_session_state(keys: Dict[str, Any]) -> None:
     """
     import streamlit as st
     
+    session_state = st.session_state
     for key, value in keys.items():
-        if key not in st.session_state:
-            st.session_state[key] = value
+        session_state.setdefault(key, value)
 
 
 def get_session_state(key: str, default: Any = None) -> Any:
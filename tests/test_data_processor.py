@@ -72,6 +72,49 @@ class TestDataProcessor(unittest.TestCase):
         # Should only have CREATE/MIGRATE
         self.assertTrue(all(df_result['CRM Order Type'].isin(['CREATE', 'MIGRATE'])))
     
+    def test_fill_contact_number(self):
+        """Test filling empty contact numbers from the same customer"""
+        df = pd.DataFrame({
+            'Customer Name': ['Customer A', 'Customer A', 'Customer B', 'Customer C'],
+            'Contact Number': ['08123456789', '', 'nan', None]
+        })
+        
+        result = DataProcessor(mode='WSA')._fill_contact_number(df)
+        
+        self.assertEqual(result['Contact Number'].iloc[1], '08123456789')
+        self.assertEqual(result['Contact Number'].iloc[2], 'nan')
+        self.assertTrue(pd.isna(result['Contact Number'].iloc[3]))
+    
+    def test_apply_all_filters(self):
+        """Test fused (lazy) filters match filtering step by step"""
+        for mode, check_col in [('WSA', None), ('MODOROSO', None), ('WAPPR', None), ('MODOROSO', 'CRM Order Type')]:
+            # Akses df_processed di tiap langkah memaksa slice per filter
+            eager = DataProcessor(mode=mode).load_data(self.sample_data).clean_common()
+            eager.filter_by_mode().df_processed
+            eager.filter_by_month([1, 2]).df_processed
+            eager.remove_duplicates(['AO123', 'WO004', 'DO'], check_col)
+            
+            fused = (DataProcessor(mode=mode)
+                .load_data(self.sample_data)
+                .clean_common()
+                .apply_all_filters([1, 2], ['AO123', 'WO004', 'DO'], check_col))
+            
+            pd.testing.assert_frame_equal(fused.df_final, eager.df_final)
+            pd.testing.assert_frame_equal(fused.df_processed, eager.df_processed)
+            self.assertEqual(fused.get_stats(), eager.get_stats())
+    
+    def test_chained_filters_are_lazy(self):
+        """Test chained filters defer slicing until df_processed is read"""
+        processor = (DataProcessor(mode='WSA')
+            .load_data(self.sample_data)
+            .clean_common()
+            .filter_by_mode()
+            .filter_by_month([1]))
+        
+        self.assertIsNotNone(processor._pending_mask)
+        self.assertEqual(len(processor.df_processed), 2)
+        self.assertIsNone(processor._pending_mask)
+    
     def test_filter_modoroso(self):
         """Test MODOROSO filtering"""
         modoroso_data = pd.DataFrame({
@@ -0,0 +1,212 @@
+"""
+Unit Tests untuk Google Sheets Module
+"""
+
+import unittest
+from unittest import mock
+import sys
+import os
+
+import gspread
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.google_sheets import GoogleSheetsManager, _with_retry, APPEND_RETRY_STATUS
+
+
+def _api_error(status: int, headers: dict = None) -> gspread.exceptions.APIError:
+    """Buat APIError palsu dengan status HTTP tertentu"""
+    response = mock.MagicMock(status_code=status, headers=headers or {})
+    response.json.return_value = {'error': {'code': status, 'message': 'error', 'status': 'ERROR'}}
+    return gspread.exceptions.APIError(response)
+
+
+@mock.patch('src.google_sheets.time.sleep')
+class TestWithRetry(unittest.TestCase):
+    """Test retry Google Sheets API"""
+    
+    def _call(self, side_effect, **kwargs):
+        fn = mock.MagicMock(side_effect=side_effect, __name__='fn')
+        return fn, _with_retry(fn, **kwargs)
+    
+    def test_retries_rate_limit_and_server_errors(self, sleep):
+        """Test 429 and 5xx are retried until the call succeeds"""
+        for status in (429, 500, 502, 503, 504):
+            fn, wrapped = self._call([_api_error(status), 'ok'])
+            self.assertEqual(wrapped(), 'ok')
+            self.assertEqual(fn.call_count, 2)
+    
+    def test_does_not_retry_client_errors(self, sleep):
+        """Test other 4xx errors are raised immediately"""
+        for status in (400, 403, 404):
+            fn, wrapped = self._call([_api_error(status), 'ok'])
+            with self.assertRaises(gspread.exceptions.APIError):
+                wrapped()
+            self.assertEqual(fn.call_count, 1)
+        
+        sleep.assert_not_called()
+    
+    def test_honours_retry_after(self, sleep):
+        """Test the Retry-After header sets the delay"""
+        fn, wrapped = self._call([_api_error(429, {'Retry-After': '7'}), 'ok'])
+        wrapped()
+        
+        delay = sleep.call_args[0][0]
+        self.assertGreaterEqual(delay, 7)
+        self.assertLess(delay, 8)
+    
+    def test_gives_up_after_max_retries(self, sleep):
+        """Test the last error is raised once retries run out"""
+        with mock.patch.dict('config.settings.GOOGLE_SHEET_CONFIG', {'max_retries': 3}):
+            fn, wrapped = self._call(_api_error(503))
+            with self.assertRaises(gspread.exceptions.APIError):
+                wrapped()
+        
+        self.assertEqual(fn.call_count, 3)
+    
+    def test_zero_max_retries_still_calls(self, sleep):
+        """Test max_retries=0 still makes one attempt"""
+        with mock.patch.dict('config.settings.GOOGLE_SHEET_CONFIG', {'max_retries': 0}):
+            fn, wrapped = self._call(['ok'])
+            self.assertEqual(wrapped(), 'ok')
+        
+        self.assertEqual(fn.call_count, 1)
+    
+    def test_append_retries_only_rate_limit(self, sleep):
+        """Test appends retry on 429 but not on 5xx"""
+        fn, wrapped = self._call([_api_error(429), 'ok'], retry_statuses=APPEND_RETRY_STATUS)
+        self.assertEqual(wrapped(), 'ok')
+        
+        fn, wrapped = self._call([_api_error(503), 'ok'], retry_statuses=APPEND_RETRY_STATUS)
+        with self.assertRaises(gspread.exceptions.APIError):
+            wrapped()
+        self.assertEqual(fn.call_count, 1)
+
+
+
+class TestActivityLog(unittest.TestCase):
+    """Test buffer log aktivitas"""
+    
+    def setUp(self):
+        """Set up manager dengan spreadsheet palsu"""
+        self.log_ws = mock.MagicMock(title='ACTIVITY_LOG')
+        self.manager = GoogleSheetsManager()
+        self.manager.spreadsheet = mock.MagicMock()
+        self.manager.spreadsheet.worksheets.return_value = [self.log_ws]
+        
+        patcher = mock.patch.dict(
+            'config.settings.GOOGLE_SHEET_CONFIG', {'log_batch_size': 3, 'log_flush_interval': 60}
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def test_log_without_spreadsheet(self):
+        """Test logging fails when no spreadsheet is open"""
+        self.manager.spreadsheet = None
+        self.assertFalse(self.manager.log_activity({'action': 'upload'}))
+    
+    def test_flush_on_batch_size(self):
+        """Test entries are buffered until the batch size is reached"""
+        for _ in range(2):
+            self.assertTrue(self.manager.log_activity({'action': 'upload'}))
+        self.log_ws.append_rows.assert_not_called()
+        
+        self.assertTrue(self.manager.log_activity({'action': 'upload'}))
+        self.assertEqual(len(self.log_ws.append_rows.call_args[0][0]), 3)
+        self.assertEqual(len(self.manager._log_q), 0)
+    
+    def test_flush_on_interval(self):
+        """Test a small buffer is flushed once the interval has passed"""
+        self.manager._log_flushed_at -= 61
+        
+        self.assertTrue(self.manager.log_activity({'action': 'upload'}))
+        self.assertEqual(len(self.log_ws.append_rows.call_args[0][0]), 1)
+    
+    def test_flush_failure_keeps_buffer(self):
+        """Test API failures return False and keep entries for the next flush"""
+        self.manager.spreadsheet.worksheets.side_effect = RuntimeError('API down')
+        
+        self.manager.log_activity({'action': 'upload'})
+        self.assertFalse(self.manager.flush_log())
+        self.assertEqual(len(self.manager._log_q), 1)
+        
+        self.manager.spreadsheet.worksheets.side_effect = None
+        self.assertTrue(self.manager.flush_log())
+        self.assertEqual(len(self.manager._log_q), 0)
+
+
+
+class TestBackupData(unittest.TestCase):
+    """Test backup worksheet"""
+    
+    def setUp(self):
+        """Set up manager dengan spreadsheet palsu"""
+        self.source = mock.MagicMock(id=1, title='WSA_DATA')
+        self.old_backup = mock.MagicMock(id=2, title='BACKUP')
+        self.new_backup = mock.MagicMock(id=3)
+        
+        self.manager = GoogleSheetsManager()
+        self.manager.spreadsheet = mock.MagicMock()
+        self.manager.spreadsheet.worksheet.side_effect = (
+            lambda name: {'WSA_DATA': self.source, 'BACKUP': self.old_backup}[name]
+        )
+        self.manager.spreadsheet.duplicate_sheet.return_value = self.new_backup
+    
+    def test_backup_replaces_old_after_duplicate(self):
+        """Test the old backup is deleted only after the new copy exists"""
+        spreadsheet = self.manager.spreadsheet
+        
+        self.assertTrue(self.manager.backup_data('WSA_DATA', 'BACKUP'))
+        
+        calls = [c[0] for c in spreadsheet.method_calls if c[0] in ('duplicate_sheet', 'del_worksheet')]
+        self.assertEqual(calls, ['duplicate_sheet', 'del_worksheet'])
+        self.assertNotEqual(spreadsheet.duplicate_sheet.call_args[1]['new_sheet_name'], 'BACKUP')
+        spreadsheet.del_worksheet.assert_called_once_with(self.old_backup)
+        self.new_backup.update_title.assert_called_once_with('BACKUP')
+    
+    def test_backup_keeps_old_when_duplicate_fails(self):
+        """Test a failed duplicate leaves the existing backup in place"""
+        self.manager.spreadsheet.duplicate_sheet.side_effect = RuntimeError('API down')
+        
+        self.assertFalse(self.manager.backup_data('WSA_DATA', 'BACKUP'))
+        self.manager.spreadsheet.del_worksheet.assert_not_called()
+    
+    def test_backup_rejects_source_name(self):
+        """Test backing up a sheet onto itself is refused"""
+        self.assertFalse(self.manager.backup_data('WSA_DATA', 'WSA_DATA'))
+        self.manager.spreadsheet.del_worksheet.assert_not_called()
+        self.manager.spreadsheet.duplicate_sheet.assert_not_called()
+
+
+
+class TestSheetInfoCache(unittest.TestCase):
+    """Test cache info sheet setelah penulisan"""
+    
+    def setUp(self):
+        """Set up manager dengan info sheet yang sudah di-cache"""
+        self.ws = mock.MagicMock(id=1, title='WSA_DATA', row_count=10, col_count=2)
+        self.manager = GoogleSheetsManager()
+        self.manager.spreadsheet = mock.MagicMock()
+        self.manager.get_worksheet = mock.MagicMock(return_value=self.ws)
+        self.manager._sheet_info_cache = ({'total_rows': 10}, 0)
+    
+    def test_resize_clears_sheet_info(self):
+        """Test growing the grid drops the cached sheet info"""
+        df = pd.DataFrame({c: range(20) for c in 'ABC'})
+        
+        self.assertTrue(self.manager.append_data(df, 'WSA_DATA', clear_first=True))
+        self.manager.spreadsheet.batch_update.assert_called_once()
+        self.assertIsNone(self.manager._sheet_info_cache)
+    
+    def test_update_clears_sheet_info(self):
+        """Test a full update drops the cached sheet info"""
+        df = pd.DataFrame({'A': [1, 2]})
+        
+        with mock.patch('src.google_sheets.set_with_dataframe', None):
+            self.assertTrue(self.manager.update_data(df, 'WSA_DATA'))
+        self.assertIsNone(self.manager._sheet_info_cache)
+
+
+if __name__ == '__main__':
+    unittest.main()
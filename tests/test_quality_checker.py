@@ -7,10 +7,15 @@ import pandas as pd
 import numpy as np
 import sys
 import os
+from unittest import mock
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.quality_checker import DataQualityChecker, QualityReport, QualityIssue, QualityLevel
+from src.quality_checker import (
+    DataQualityChecker, QualityReport, QualityIssue, QualityLevel,
+    _scan_string_col, _scan_string_series
+)
+from config.settings import QUALITY_CONFIG
 
 
 class TestDataQualityChecker(unittest.TestCase):
@@ -38,6 +43,15 @@ class TestDataQualityChecker(unittest.TestCase):
         self.assertIsNotNone(checker.df)
         self.assertEqual(len(checker.issues), 0)
     
+    def test_initialization_keeps_source_intact(self):
+        """Test checker and fixes do not modify the source DataFrame"""
+        original = self.dirty_data.copy()
+        checker = DataQualityChecker(self.dirty_data)
+        checker.run_all_checks()
+        checker.fix_common_issues()
+        
+        pd.testing.assert_frame_equal(self.dirty_data, original)
+    
     def test_check_completeness_clean(self):
         """Test completeness check on clean data"""
         checker = DataQualityChecker(self.clean_data)
@@ -80,6 +94,17 @@ class TestDataQualityChecker(unittest.TestCase):
         uniqueness_issues = [i for i in checker.issues if i.issue_type == 'uniqueness']
         self.assertGreater(len(uniqueness_issues), 0)
     
+    @mock.patch.dict(QUALITY_CONFIG, {'duplicate_subset': ['B']})
+    def test_check_uniqueness_subset(self):
+        """Test uniqueness check on configured key columns only"""
+        checker = DataQualityChecker(self.dirty_data)
+        checker.check_uniqueness()
+        
+        uniqueness_issues = [i for i in checker.issues if i.issue_type == 'uniqueness']
+        self.assertEqual(len(uniqueness_issues), 1)
+        self.assertEqual(uniqueness_issues[0].column, 'B')
+        self.assertEqual(uniqueness_issues[0].affected_rows, 3)
+    
     def test_check_validity_phone(self):
         """Test phone validation"""
         checker = DataQualityChecker(self.dirty_data)
@@ -98,6 +123,55 @@ class TestDataQualityChecker(unittest.TestCase):
         validity_issues = [i for i in checker.issues if i.issue_type == 'validity' and i.column == 'Date Created']
         self.assertGreater(len(validity_issues), 0)
     
+    @mock.patch.dict(QUALITY_CONFIG, {'keep_indices': True})
+    def test_check_validity_indices(self):
+        """Test validity check flags the same rows as the scalar validators"""
+        checker = DataQualityChecker(self.dirty_data)
+        checker.check_validity()
+        
+        phone_issue = checker.get_issues_by_column('Contact Number')[0]
+        date_issue = checker.get_issues_by_column('Date Created')[0]
+        
+        # 'invalid' and '123' are invalid phones, empty strings are skipped
+        self.assertEqual(phone_issue.affected_indices.tolist(), [1, 4])
+        self.assertEqual(date_issue.affected_indices.tolist(), [1])
+    
+    def test_check_validity_datetime_column(self):
+        """Test already-parsed datetime columns are not flagged"""
+        df = pd.DataFrame({
+            'Date Created': pd.to_datetime(['2024-01-15 10:30:00.123', None, '2024-02-01'], format='mixed')
+        })
+        checker = DataQualityChecker(df)
+        checker.check_validity()
+        
+        self.assertEqual(checker.get_issues_by_column('Date Created'), [])
+    
+    @mock.patch.dict(QUALITY_CONFIG, {'keep_indices': True})
+    def test_check_consistency_whitespace_indices(self):
+        """Test whitespace issue reports the affected row indices"""
+        df = pd.DataFrame({'A': ['ok', ' pad', None, 'tail ']})
+        checker = DataQualityChecker(df)
+        checker.check_consistency()
+        
+        issue = [i for i in checker.issues if i.severity == 'info'][0]
+        self.assertEqual(issue.affected_rows, 2)
+        self.assertEqual(issue.affected_indices.tolist(), [1, 3])
+    
+    def test_scan_string_series_matches_scan(self):
+        """Test vectorized (high-cardinality) and per-unique scans give the same counts"""
+        values = ['ABC', 'abc', 'Abc', ' pad', 'tail ', '123']
+        for data in ([v + str(i) for i, v in enumerate(values * 50)], values * 50):
+            expected = _scan_string_col(data)
+            self.assertEqual(_scan_string_series(pd.Series(data, dtype='string')), expected)
+    
+    def test_affected_indices_not_kept_by_default(self):
+        """Test issues skip row indices unless keep_indices is enabled"""
+        checker = DataQualityChecker(self.dirty_data)
+        checker.run_all_checks()
+        
+        self.assertGreater(len(checker.issues), 0)
+        self.assertTrue(all(i.affected_indices is None for i in checker.issues))
+    
     def test_run_all_checks(self):
         """Test running all checks"""
         checker = DataQualityChecker(self.dirty_data)
@@ -110,6 +184,16 @@ class TestDataQualityChecker(unittest.TestCase):
         self.assertIn('issues', result)
         self.assertIn('recommendations', result)
     
+    def test_run_all_checks_parallel(self):
+        """Test parallel checks give the same result as sequential"""
+        sequential = DataQualityChecker(self.dirty_data).run_all_checks()
+        
+        with mock.patch.dict(QUALITY_CONFIG, {'parallel_min_rows': 0}):
+            parallel = DataQualityChecker(self.dirty_data).run_all_checks()
+        
+        self.assertEqual(parallel['scores'], sequential['scores'])
+        self.assertEqual(parallel['issues'], sequential['issues'])
+    
     def test_overall_score_calculation(self):
         """Test overall score calculation"""
         checker = DataQualityChecker(self.clean_data)
@@ -173,6 +257,19 @@ class TestDataQualityChecker(unittest.TestCase):
         # Check whitespace is trimmed
         self.assertEqual(fixed_df['A'].iloc[0], 'test')
         self.assertEqual(fixed_df['A'].iloc[2], 'world')
+    
+    def test_fix_common_issues_keeps_nulls(self):
+        """Test fixing issues does not turn nulls into 'nan' strings"""
+        df = pd.DataFrame({
+            'A': [' x ', None, 'y'],
+            'Contact Number': ['0812-345', np.nan, '(021) 555']
+        })
+        
+        fixed_df = DataQualityChecker(df).fix_common_issues()
+        
+        self.assertTrue(pd.isna(fixed_df['A'].iloc[1]))
+        self.assertTrue(pd.isna(fixed_df['Contact Number'].iloc[1]))
+        self.assertEqual(fixed_df['Contact Number'].iloc[0], '0812345')
 
 
 class TestQualityReport(unittest.TestCase):
@@ -204,6 +301,15 @@ class TestQualityReport(unittest.TestCase):
         self.assertIsInstance(report_text, str)
         self.assertIn('DATA QUALITY REPORT', report_text)
         self.assertIn('Overall Score', report_text)
+    
+    def test_checks_run_once(self):
+        """Test both reports reuse one run_all_checks result"""
+        with mock.patch.object(self.checker, 'run_all_checks',
+                               wraps=self.checker.run_all_checks) as run:
+            self.report.generate_summary_card()
+            self.report.generate_detailed_report()
+        
+        self.assertEqual(run.call_count, 1)
 
 
 class TestQualityLevel(unittest.TestCase):
@@ -2,7 +2,10 @@
 Unit Tests untuk Utils Module
 """
 
+import io
+import json
 import unittest
+from unittest import mock
 import pandas as pd
 import numpy as np
 from datetime import datetime
@@ -13,11 +16,15 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.utils import (
-    parse_date, format_date, get_bulan_indonesia, get_current_period,
-    clean_string, normalize_phone, validate_phone, extract_order_id,
+    setup_logger, _log_listeners,
+    parse_date, parse_date_series, format_date, get_bulan_indonesia, get_current_period,
+    clean_string, clean_string_series, normalize_phone, normalize_phone_series,
+    validate_phone, validate_phone_array, extract_order_id,
     clean_dataframe, reorder_columns, get_column_stats,
-    validate_file_extension, validate_required_columns,
-    memory_usage, chunk_list
+    validate_file_extension, validate_required_columns, generate_hash, generate_hashes,
+    mask_sensitive_data, mask_series,
+    memory_usage, chunk_list, chunk_array,
+    export_to_excel, export_to_excel_segmented, export_to_csv, export_to_json, export_to_parquet
 )
 
 
@@ -41,6 +48,20 @@ class TestDateUtils(unittest.TestCase):
         result = parse_date('2024-01-15.0')
         self.assertIsNotNone(result)
     
+    def test_parse_date_series(self):
+        """Test vectorized parsing matches parse_date"""
+        values = pd.Series(['2024-01-15 10:30:00', '25/01/2024 08:00', '01/25/2024',
+                            '2024-01-15.0', 'invalid_date', '', None], dtype=object)
+        result = parse_date_series(values)
+        expected = values.apply(parse_date)
+        
+        self.assertTrue(pd.api.types.is_datetime64_any_dtype(result))
+        for got, exp in zip(result, expected):
+            if exp is None or pd.isna(exp):
+                self.assertTrue(pd.isna(got))
+            else:
+                self.assertEqual(got, exp)
+    
     def test_format_date(self):
         """Test formatting dates"""
         date_obj = datetime(2024, 1, 15, 10, 30, 0)
@@ -100,6 +121,24 @@ class TestStringUtils(unittest.TestCase):
         self.assertFalse(validate_phone('123'))
         self.assertFalse(validate_phone(''))
     
+    def test_validate_phone_array(self):
+        """Test bulk phone validation matches validate_phone"""
+        phones = ['08123456789', '+62 812-3456-789', '123', '', np.nan]
+        result = validate_phone_array(phones)
+        self.assertEqual(result.tolist(), [True, True, False, False, False])
+    
+    def test_clean_string_series(self):
+        """Test bulk cleaning matches clean_string"""
+        values = ['  test  ', '123.0', 7.0, None, np.nan, 'abc']
+        result = clean_string_series(values, uppercase=True)
+        self.assertEqual(result.tolist(), [clean_string(v, uppercase=True) for v in values])
+    
+    def test_normalize_phone_series(self):
+        """Test bulk phone normalization matches normalize_phone"""
+        phones = ['08123456789', '8123456789', '+62 812-3456-789', '', None]
+        result = normalize_phone_series(phones)
+        self.assertEqual(result.tolist(), [normalize_phone(p) for p in phones])
+    
     def test_extract_order_id(self):
         """Test extracting order ID"""
         self.assertEqual(extract_order_id('ORDER_123_456'), 'ORDER')
@@ -123,6 +162,16 @@ class TestDataFrameUtils(unittest.TestCase):
         self.assertIsInstance(result, pd.DataFrame)
         self.assertEqual(len(result), 4)
     
+    def test_clean_dataframe_values(self):
+        """Test cleaning string values and null markers"""
+        df = pd.DataFrame({'A': ['  x  ', 'NULL', '123.0', np.nan]})
+        result = clean_dataframe(df)
+        self.assertEqual(result['A'].tolist(), ['x', '', '123', ''])
+        
+        # Kolom string non-object (mis. 'str' default pandas 3) juga dibersihkan
+        df = pd.DataFrame({'A': pd.array(['  x  ', '123.0', None], dtype='string')})
+        self.assertEqual(clean_dataframe(df)['A'].tolist(), ['x', '123', ''])
+    
     def test_reorder_columns(self):
         """Test reordering columns"""
         result = reorder_columns(self.df, ['C', 'A', 'B'])
@@ -155,6 +204,8 @@ class TestValidationUtils(unittest.TestCase):
         """Test validating invalid file extensions"""
         self.assertFalse(validate_file_extension('test.txt'))
         self.assertFalse(validate_file_extension('test.pdf'))
+        self.assertFalse(validate_file_extension('.csv'))
+        self.assertFalse(validate_file_extension('data.csv/file'))
     
     def test_validate_required_columns_all_present(self):
         """Test validating when all columns present"""
@@ -171,17 +222,150 @@ class TestValidationUtils(unittest.TestCase):
         self.assertEqual(missing, ['C'])
 
 
+class TestSecurityUtils(unittest.TestCase):
+    """Test security utility functions"""
+    
+    def test_generate_hashes(self):
+        """Test bulk hashing matches generate_hash"""
+        items = ['AO123', 'WSA789', '']
+        self.assertEqual(generate_hashes(items), [generate_hash(i) for i in items])
+    
+    def test_mask_series(self):
+        """Test vectorized masking matches mask_sensitive_data"""
+        values = ['08123456789', 'abc', 'abcd', '']
+        result = mask_series(pd.Series(values + [None]))
+        
+        self.assertEqual(result.tolist()[:-1], [mask_sensitive_data(v) for v in values])
+        self.assertTrue(pd.isna(result.iloc[-1]))
+
+
+class TestExportUtils(unittest.TestCase):
+    """Test export utility functions"""
+    
+    def setUp(self):
+        """Set up test data"""
+        self.df = pd.DataFrame({
+            'A': ['x', None, 'z'],
+            'B': [1.5, np.nan, 3.0]
+        })
+    
+    def test_export_to_excel(self):
+        """Test exporting to Excel"""
+        result = pd.read_excel(io.BytesIO(export_to_excel(self.df)))
+        pd.testing.assert_frame_equal(result, self.df.fillna(np.nan))
+    
+    def test_export_to_excel_streaming(self):
+        """Test exporting large data through the streaming writer"""
+        with mock.patch.dict('config.settings.EXPORT_CONFIG', {'streaming_min_rows': 1}):
+            result = pd.read_excel(io.BytesIO(export_to_excel(self.df)))
+        
+        pd.testing.assert_frame_equal(result, self.df.fillna(np.nan))
+    
+    def test_export_to_excel_null_column(self):
+        """Test exporting a frame with an all-null column"""
+        df = pd.DataFrame({'A': ['x', 'y'], 'Empty': [None, None], 'NaN': [np.nan, np.nan]})
+        
+        for config in ({}, {'streaming_min_rows': 1}):
+            with mock.patch.dict('config.settings.EXPORT_CONFIG', config):
+                result = pd.read_excel(io.BytesIO(export_to_excel(df)))
+            
+            self.assertEqual(list(result.columns), ['A', 'Empty', 'NaN'])
+            self.assertTrue(result['Empty'].isna().all())
+    
+    def test_export_to_excel_segmented(self):
+        """Test splitting Excel export into several files"""
+        df = pd.DataFrame({'A': ['x', 'y', 'z'], 'B': [1, 2, 3]})
+        parts = list(export_to_excel_segmented(df, rows_per_file=2))
+        
+        self.assertEqual(len(parts), 2)
+        self.assertTrue(parts[0][0].endswith('_part1.xlsx'))
+        
+        result = pd.concat(
+            [pd.read_excel(io.BytesIO(data)) for _, data in parts], ignore_index=True
+        )
+        pd.testing.assert_frame_equal(result, df)
+    
+    def test_export_to_csv(self):
+        """Test exporting to CSV with BOM"""
+        data = export_to_csv(self.df)
+        self.assertTrue(data.startswith(b'\xef\xbb\xbf'))
+        
+        result = pd.read_csv(io.BytesIO(data), encoding='utf-8-sig')
+        pd.testing.assert_frame_equal(result, self.df.fillna(np.nan))
+    
+    def test_export_to_csv_matches_pandas(self):
+        """Test CSV bytes are identical to df.to_csv()"""
+        df = pd.DataFrame({
+            'Order ID': ['AO1', 'a,b', 'say "hi"', None],
+            'Rows': [1, 2, 3, 4],
+            'Rate': [1.0, 0.1, np.nan, 1e-05],
+            'Valid': [True, False, True, False],
+            'Created': pd.to_datetime(['2024-01-01', '2024-01-02', None, '2024-01-04']),
+            'Updated': pd.to_datetime(['2024-01-01 10:00:00', None, '2024-01-03 00:00:00', '2024-01-04 23:59:59'])
+        })
+        
+        for frame in (df, df.drop(columns='Order ID')):
+            expected = frame.to_csv(index=False).encode('utf-8-sig')
+            self.assertEqual(export_to_csv(frame), expected)
+    
+    def test_export_to_json(self):
+        """Test exporting to JSON records and NDJSON"""
+        records = json.loads(export_to_json(self.df))
+        self.assertEqual(records, [{'A': 'x', 'B': 1.5}, {'A': None, 'B': None}, {'A': 'z', 'B': 3.0}])
+        
+        lines = export_to_json(self.df, lines=True).decode('utf-8').splitlines()
+        self.assertEqual([json.loads(line) for line in lines], records)
+    
+    def test_export_to_json_datetime(self):
+        """Test datetime columns use the same ISO format as pandas"""
+        df = pd.DataFrame({
+            'Created': pd.to_datetime(['2024-01-01 10:00:00', None]),
+            'Updated': pd.to_datetime(['2024-01-01 10:00:00.123456789', '2024-01-02 00:00:00'], format='ISO8601')
+        })
+        
+        records = json.loads(export_to_json(df))
+        self.assertEqual(records[0], {'Created': '2024-01-01T10:00:00.000', 'Updated': '2024-01-01T10:00:00.123'})
+        self.assertEqual(records[1], {'Created': None, 'Updated': '2024-01-02T00:00:00.000'})
+        self.assertEqual(records, json.loads(df.to_json(orient='records', date_format='iso')))
+    
+    def test_export_to_parquet(self):
+        """Test exporting to Parquet keeps dtypes"""
+        result = pd.read_parquet(io.BytesIO(export_to_parquet(self.df)))
+        pd.testing.assert_frame_equal(result, self.df)
+
+
 class TestPerformanceUtils(unittest.TestCase):
     """Test performance utility functions"""
     
     def test_chunk_list(self):
         """Test chunking list"""
         lst = list(range(10))
-        result = chunk_list(lst, 3)
+        result = list(chunk_list(lst, 3))
         self.assertEqual(len(result), 4)
         self.assertEqual(result[0], [0, 1, 2])
         self.assertEqual(result[-1], [9])
     
+    def test_chunk_array(self):
+        """Test chunking array into views"""
+        arr = np.arange(10)
+        result = list(chunk_array(arr, 3))
+        self.assertEqual([len(c) for c in result], [3, 3, 3, 1])
+        self.assertTrue(np.shares_memory(result[0], arr))
+    
+    def test_setup_logger_keeps_other_listeners(self):
+        """Test setting up one logger does not stop another logger's listener"""
+        with mock.patch.dict('config.settings.LOG_CONFIG', {'enabled': False, 'console_output': True}):
+            setup_logger('TEST_FIRST')
+            first = _log_listeners['TEST_FIRST']
+            setup_logger('TEST_SECOND')
+        
+        try:
+            self.assertIs(_log_listeners['TEST_FIRST'], first)
+            self.assertIsNotNone(first._thread)
+        finally:
+            for name in ('TEST_FIRST', 'TEST_SECOND'):
+                _log_listeners.pop(name).stop()
+    
     def test_memory_usage(self):
         """Test memory usage calculation"""
         df = pd.DataFrame({'A': range(1000)})